@@ -5,7 +5,7 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from .jwt import verify_token
+from .jwt import verify_token_cached
 from ..cache import get_storage
 from ..models import UserRole
 
@@ -83,7 +83,7 @@ async def get_current_user(
         HTTPException: 401 if token invalid or user not found/inactive
     """
     token = credentials.credentials
-    payload = verify_token(token)
+    payload = verify_token_cached(token)
 
     # Verify token is valid and is an access token
     if not payload or payload.get("type") != "access":
@@ -4,7 +4,9 @@ JWT Token Management - Access and refresh token generation/verification.
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt, JWTError
+import hashlib
 import secrets
+import time
 
 from ..auth_config import auth_settings
 
@@ -44,6 +46,44 @@ def create_access_token(user_id: int, company_id: int, email: str, role: str, ro
     return jwt.encode(payload, auth_settings.JWT_SECRET_KEY, algorithm=auth_settings.JWT_ALGORITHM)
 
 
+# Access tokens minted within this window are handed out again for the same claims
+ACCESS_TOKEN_REUSE_SECONDS = 60
+ACCESS_TOKEN_REUSE_CACHE_SIZE = 10_000
+
+# (user_id, company_id, email, role, role_level) -> (minted_at monotonic, token)
+_recent_access_tokens: dict[tuple, tuple[float, str]] = {}
+
+
+def reuse_or_create_access_token(
+    user_id: int, company_id: int, email: str, role: str, role_level: int = None
+) -> tuple[str, int]:
+    """
+    Return an access token for these claims and its remaining lifetime in seconds.
+
+    A token minted for the same claims in the last ACCESS_TOKEN_REUSE_SECONDS is
+    returned again, so bursts of refreshes (several tabs, double-mounted clients)
+    don't each sign a new JWT. A role change changes the key and mints a new one.
+    """
+    if role_level is None:
+        from ..models import UserRole
+        role_level = UserRole.get_level(role)
+
+    lifetime = auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    key = (user_id, company_id, email, role, role_level)
+    now = time.monotonic()
+    entry = _recent_access_tokens.get(key)
+    if entry is not None and now - entry[0] < ACCESS_TOKEN_REUSE_SECONDS:
+        return entry[1], lifetime - int(now - entry[0])
+
+    token = create_access_token(user_id, company_id, email, role, role_level=role_level)
+    _recent_access_tokens.pop(key, None)
+    if len(_recent_access_tokens) >= ACCESS_TOKEN_REUSE_CACHE_SIZE:
+        # Oldest insertion first
+        del _recent_access_tokens[next(iter(_recent_access_tokens))]
+    _recent_access_tokens[key] = (now, token)
+    return token, lifetime
+
+
 def create_refresh_token() -> str:
     """
     Create a cryptographically secure refresh token.
@@ -75,6 +115,36 @@ def verify_token(token: str) -> Optional[dict]:
         return None
 
 
+VERIFIED_TOKEN_CACHE_SIZE = 50_000
+
+# blake2b digest of the raw token -> verified payload (the token itself is never stored)
+_verified_tokens: dict[bytes, dict] = {}
+
+
+def verify_token_cached(token: str) -> Optional[dict]:
+    """
+    verify_token with memoized results for valid tokens.
+
+    A token's claims can't change before it expires, so a hit only re-checks "exp".
+    Used by the per-request auth paths; callers must treat the payload as read-only.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            return payload
+        del _verified_tokens[key]
+        return None
+
+    payload = verify_token(token)
+    if payload is not None and "exp" in payload:
+        if len(_verified_tokens) >= VERIFIED_TOKEN_CACHE_SIZE:
+            # Oldest insertion first
+            del _verified_tokens[next(iter(_verified_tokens))]
+        _verified_tokens[key] = payload
+    return payload
+
+
 def create_onboarding_token(
     google_id: str,
     email: str,
@@ -7,7 +7,7 @@ from datetime import date
 from collections import defaultdict
 from typing import Optional
 
-from .models import Worklog, BillingPreviewLineItem, BillingPreviewResponse
+from .models import Worklog, BillingPreviewLineItem, BillingPreviewResponse, BillingGroupBy
 from .cache import get_storage
 
 
@@ -87,7 +87,7 @@ async def compute_billing_preview(
     client_id: int,
     period_start: date,
     period_end: date,
-    group_by: str = "project",
+    group_by: BillingGroupBy = "project",
     billing_project_id: Optional[int] = None
 ) -> BillingPreviewResponse:
     """
@@ -9,7 +9,9 @@ from pathlib import Path
 from typing import Optional
 import asyncio
 
-from .models import Worklog, Epic, Issue, UserRole
+from pydantic import ValidationError
+
+from .models import Worklog, Epic, Issue, UserRole, WORKLOG_LIST_ADAPTER
 
 
 class WorklogStorage:
@@ -817,6 +819,15 @@ class WorklogStorage:
                 except Exception:
                     pass  # Column already exists
 
+                # Add company_id to linked_issues
+                try:
+                    await db.execute("""
+                        ALTER TABLE linked_issues
+                        ADD COLUMN company_id INTEGER REFERENCES companies(id) ON DELETE CASCADE
+                    """)
+                except Exception:
+                    pass  # Column already exists
+
                 # Add company_id to logs (optional - for filtering)
                 try:
                     await db.execute("""
@@ -979,6 +990,16 @@ class WorklogStorage:
                 except Exception:
                     pass  # Columns already exist
 
+                # Add is_active to users table (soft delete of team members)
+                try:
+                    await db.execute("""
+                        ALTER TABLE users
+                        ADD COLUMN is_active INTEGER DEFAULT 1
+                    """)
+                    await db.commit()
+                except Exception:
+                    pass  # Column already exists
+
                 # Index for role-based queries on users
                 await db.execute("""
                     CREATE INDEX IF NOT EXISTS idx_users_role_level
@@ -1229,15 +1250,23 @@ class WorklogStorage:
         
         query += " ORDER BY started DESC"
         
-        worklogs = []
         async with aiosqlite.connect(self.db_path) as db:
             async with db.execute(query, params) as cursor:
-                async for row in cursor:
-                    try:
-                        worklogs.append(Worklog(**json.loads(row[0])))
-                    except Exception as e:
-                        print(f"Error parsing worklog: {e}")
-        
+                rows = [row[0] async for row in cursor]
+
+        # Validate the whole result set in a single pydantic-core pass
+        try:
+            return WORKLOG_LIST_ADAPTER.validate_json("[" + ",".join(rows) + "]")
+        except (ValidationError, TypeError):
+            pass  # Fall back to per-row parsing so one bad row doesn't drop the rest
+
+        worklogs = []
+        for data in rows:
+            try:
+                worklogs.append(Worklog(**json.loads(data)))
+            except Exception as e:
+                print(f"Error parsing worklog: {e}")
+
         return worklogs
     
     async def upsert_worklogs(self, worklogs: list[Worklog], company_id: int) -> tuple[int, int]:
@@ -1288,7 +1317,7 @@ class WorklogStorage:
             unique_id = f"{wl.id}__{wl.jira_instance.replace(' ', '_')}"
 
             # Create new worklog with unique ID
-            wl_copy = Worklog(
+            wl_copy = Worklog.model_construct(
                 id=unique_id,  # Unique composite ID
                 issue_key=wl.issue_key,
                 issue_summary=wl.issue_summary,
@@ -3610,21 +3639,40 @@ class WorklogStorage:
 
     # ========== Linked Issues Operations ==========
 
-    async def save_linked_issues(self, links: list[dict]) -> bool:
-        """Save linked issues. Each dict has: link_group_id, issue_key, jira_instance, element_name."""
+    async def save_linked_issues(self, links: list[dict], company_id: int) -> bool:
+        """Save linked issues for a company. Each dict has: link_group_id, issue_key, jira_instance, element_name.
+
+        Args:
+            links: Link records to save
+            company_id: Company ID (REQUIRED for multi-tenant isolation)
+        """
+        if not company_id:
+            raise ValueError("company_id is required")
+
         await self.initialize()
 
         async with aiosqlite.connect(self.db_path) as db:
-            for link in links:
-                await db.execute("""
-                    INSERT OR REPLACE INTO linked_issues (link_group_id, issue_key, jira_instance, element_name)
-                    VALUES (?, ?, ?, ?)
-                """, (link["link_group_id"], link["issue_key"], link["jira_instance"], link.get("element_name")))
+            await db.executemany("""
+                INSERT OR REPLACE INTO linked_issues (link_group_id, issue_key, jira_instance, element_name, company_id)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (link["link_group_id"], link["issue_key"], link["jira_instance"], link.get("element_name"), company_id)
+                for link in links
+            ])
             await db.commit()
         return True
 
-    async def get_linked_issues_by_key(self, issue_key: str, jira_instance: str) -> list[dict]:
-        """Find all issues linked to a given issue (same link_group_id)."""
+    async def get_linked_issues_by_key(self, issue_key: str, jira_instance: str, company_id: int) -> list[dict]:
+        """Find all issues linked to a given issue (same link_group_id) within a company.
+
+        Args:
+            issue_key: Issue key to look up
+            jira_instance: JIRA instance the issue belongs to
+            company_id: Company ID (REQUIRED for multi-tenant isolation)
+        """
+        if not company_id:
+            raise ValueError("company_id is required")
+
         await self.initialize()
 
         results = []
@@ -3632,8 +3680,8 @@ class WorklogStorage:
             # First find the link_group_id(s) for this issue
             async with db.execute("""
                 SELECT link_group_id FROM linked_issues
-                WHERE issue_key = ? AND jira_instance = ?
-            """, (issue_key, jira_instance)) as cursor:
+                WHERE issue_key = ? AND jira_instance = ? AND company_id = ?
+            """, (issue_key, jira_instance, company_id)) as cursor:
                 group_ids = [row[0] async for row in cursor]
 
             if not group_ids:
@@ -3645,9 +3693,10 @@ class WorklogStorage:
                 SELECT id, link_group_id, issue_key, jira_instance, element_name, created_at
                 FROM linked_issues
                 WHERE link_group_id IN ({placeholders})
+                AND company_id = ?
                 AND NOT (issue_key = ? AND jira_instance = ?)
                 ORDER BY link_group_id, jira_instance
-            """, (*group_ids, issue_key, jira_instance)) as cursor:
+            """, (*group_ids, company_id, issue_key, jira_instance)) as cursor:
                 async for row in cursor:
                     results.append({
                         "id": row[0],
@@ -3659,8 +3708,16 @@ class WorklogStorage:
                     })
         return results
 
-    async def get_linked_issues_by_group(self, link_group_id: str) -> list[dict]:
-        """Get all issues in a link group."""
+    async def get_linked_issues_by_group(self, link_group_id: str, company_id: int) -> list[dict]:
+        """Get all issues in a link group within a company.
+
+        Args:
+            link_group_id: Link group to list
+            company_id: Company ID (REQUIRED for multi-tenant isolation)
+        """
+        if not company_id:
+            raise ValueError("company_id is required")
+
         await self.initialize()
 
         results = []
@@ -3668,9 +3725,9 @@ class WorklogStorage:
             async with db.execute("""
                 SELECT id, link_group_id, issue_key, jira_instance, element_name, created_at
                 FROM linked_issues
-                WHERE link_group_id = ?
+                WHERE link_group_id = ? AND company_id = ?
                 ORDER BY jira_instance
-            """, (link_group_id,)) as cursor:
+            """, (link_group_id, company_id)) as cursor:
                 async for row in cursor:
                     results.append({
                         "id": row[0],
@@ -5090,6 +5147,32 @@ class WorklogStorage:
                 row = await cursor.fetchone()
                 return dict(row) if row else None
 
+    async def get_user_with_company(self, user_id: int) -> Optional[dict]:
+        """Get OAuth user and their active company in one query.
+
+        Returns:
+            {"user": dict, "company": dict or None}, or None if the user does not exist
+        """
+        await self.initialize()
+        async with aiosqlite.connect(self.db_path) as db:
+            # The NULL marker column splits the joined row into user and company columns
+            async with db.execute("""
+                SELECT u.*, NULL AS _company_columns, c.*
+                FROM oauth_users u
+                LEFT JOIN companies c ON c.id = u.company_id AND c.is_active = 1
+                WHERE u.id = ?
+            """, (user_id,)) as cursor:
+                row = await cursor.fetchone()
+                if not row:
+                    return None
+                columns = [d[0] for d in cursor.description]
+                split = columns.index("_company_columns")
+                company = dict(zip(columns[split + 1:], row[split + 1:]))
+                return {
+                    "user": dict(zip(columns[:split], row[:split])),
+                    "company": company if company.get("id") is not None else None,
+                }
+
     async def get_oauth_user_by_google_id(self, google_id: str) -> Optional[dict]:
         """Get OAuth user by Google ID."""
         await self.initialize()
@@ -5299,6 +5382,7 @@ class WorklogStorage:
 
             # 12. Delete package templates (auto-deletes: package_template_elements, package_template_instances via CASCADE)
             await db.execute("DELETE FROM package_templates WHERE company_id = ?", (company_id,))
+            await db.execute("DELETE FROM linked_issues WHERE company_id = ?", (company_id,))
 
             # 13. Delete holidays
             await db.execute("DELETE FROM holidays WHERE company_id = ?", (company_id,))
@@ -3,6 +3,7 @@ Configuration loader for the JIRA Worklog Dashboard.
 Loads and validates the YAML configuration file.
 """
 import os
+import time
 from pathlib import Path
 from functools import lru_cache
 from typing import Optional, List, Dict, Set
@@ -67,9 +68,14 @@ def load_config_from_file(path: Path) -> AppConfig:
     )
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
-    """Get the application configuration (cached)."""
+    """
+    Get the application configuration (cached).
+
+    The YAML file is parsed once per process; call ``get_config.cache_clear()``
+    to force a reload.
+    """
     try:
         config_path = find_config_file()
         return load_config_from_file(config_path)
@@ -82,6 +88,109 @@ def get_config() -> AppConfig:
         )
 
 
+# ========== /api/config Payload Cache ==========
+
+CONFIG_INFO_TTL_SECONDS = 30.0
+
+# company_id -> (expires_at, company-scoped /api/config payload)
+_config_info_cache: Dict[int, tuple[float, dict]] = {}
+
+
+def get_cached_config_info(company_id: int) -> Optional[dict]:
+    """Return the cached /api/config payload for a company, or None if missing/expired."""
+    entry = _config_info_cache.get(company_id)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def set_cached_config_info(company_id: int, payload: dict) -> None:
+    """Cache the company-scoped /api/config payload for CONFIG_INFO_TTL_SECONDS."""
+    _config_info_cache[company_id] = (time.monotonic() + CONFIG_INFO_TTL_SECONDS, payload)
+
+
+def invalidate_config_info(company_id: Optional[int] = None) -> None:
+    """Drop the cached /api/config payload for one company, or for all if None."""
+    if company_id is None:
+        _config_info_cache.clear()
+    else:
+        _config_info_cache.pop(company_id, None)
+    # Teams/users feed the dashboard aggregates too
+    invalidate_dashboard_responses(company_id)
+
+
+# ========== Dashboard Response Cache ==========
+
+DASHBOARD_RESPONSE_TTL_SECONDS = 30.0
+DASHBOARD_RESPONSE_CACHE_SIZE = 256
+
+# (company_id, endpoint, *query params) -> (expires_at, serialized JSON body)
+_dashboard_response_cache: Dict[tuple, tuple[float, bytes]] = {}
+
+
+def get_cached_dashboard_response(key: tuple) -> Optional[bytes]:
+    """Return a cached serialized dashboard response, or None if missing/expired."""
+    entry = _dashboard_response_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def set_cached_dashboard_response(key: tuple, body: bytes) -> None:
+    """Cache a serialized dashboard response for DASHBOARD_RESPONSE_TTL_SECONDS (key[0] is the company id)."""
+    _dashboard_response_cache.pop(key, None)
+    if len(_dashboard_response_cache) >= DASHBOARD_RESPONSE_CACHE_SIZE:
+        # Oldest insertion first
+        del _dashboard_response_cache[next(iter(_dashboard_response_cache))]
+    _dashboard_response_cache[key] = (time.monotonic() + DASHBOARD_RESPONSE_TTL_SECONDS, body)
+
+
+def invalidate_dashboard_responses(company_id: Optional[int] = None) -> None:
+    """Drop cached dashboard responses for one company (e.g. after a sync), or for all if None."""
+    if company_id is None:
+        _dashboard_response_cache.clear()
+    else:
+        for key in [k for k in _dashboard_response_cache if k[0] == company_id]:
+            del _dashboard_response_cache[key]
+
+
+# ========== /api/auth/me Response Cache ==========
+
+ME_RESPONSE_TTL_SECONDS = 60.0
+ME_RESPONSE_CACHE_SIZE = 10_000
+
+# user_id -> (expires_at, company_id, serialized {"user", "company"} JSON body)
+_me_response_cache: Dict[int, tuple[float, int, bytes]] = {}
+
+
+def get_cached_me_response(user_id: int) -> Optional[bytes]:
+    """Return the cached /me body for a user, or None if missing/expired."""
+    entry = _me_response_cache.get(user_id)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[2]
+    return None
+
+
+def set_cached_me_response(user_id: int, company_id: int, body: bytes) -> None:
+    """Cache a serialized /me body for ME_RESPONSE_TTL_SECONDS."""
+    _me_response_cache.pop(user_id, None)
+    if len(_me_response_cache) >= ME_RESPONSE_CACHE_SIZE:
+        # Oldest insertion first
+        del _me_response_cache[next(iter(_me_response_cache))]
+    _me_response_cache[user_id] = (time.monotonic() + ME_RESPONSE_TTL_SECONDS, company_id, body)
+
+
+def invalidate_me_responses(user_id: Optional[int] = None, company_id: Optional[int] = None) -> None:
+    """Drop cached /me bodies for one user, every user of a company, or all if neither is given."""
+    if user_id is not None:
+        _me_response_cache.pop(user_id, None)
+    elif company_id is not None:
+        for key in [k for k, entry in _me_response_cache.items() if entry[1] == company_id]:
+            del _me_response_cache[key]
+    else:
+        _me_response_cache.clear()
+
+
 def get_user_team(email: str, config: AppConfig) -> Optional[str]:
     """Find which team a user belongs to."""
     for team in config.teams:
@@ -239,9 +348,10 @@ async def get_jira_instances_from_db(company_id: int) -> List[JiraInstanceConfig
 
     instances = await storage.get_all_jira_instances(company_id, include_credentials=True)
 
-    # Return JIRA instances from database (no fallback to config.yaml)
+    # Return JIRA instances from database (no fallback to config.yaml);
+    # rows were validated on write, so skip re-validation on every request
     return [
-        JiraInstanceConfig(
+        JiraInstanceConfig.model_construct(
             name=inst["name"],
             url=inst["url"],
             email=inst["email"],
@@ -3,13 +3,68 @@ Async JIRA API client for fetching worklogs and epics.
 Supports multiple JIRA instances with Basic Auth.
 """
 import httpx
+from collections import OrderedDict
 from datetime import datetime, date
 from typing import Optional
 import asyncio
 import base64
 
-from .models import Worklog, Epic, Issue, JiraInstanceConfig, AppConfig
+from .models import (
+    Worklog, Epic, Issue, JiraInstanceConfig, AppConfig,
+    WORKLOG_LIST_ADAPTER, EPIC_LIST_ADAPTER
+)
 from .cache import get_cache
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# One pooled HTTP client per (event loop, JIRA base URL, credentials). JiraClient objects
+# are short-lived (one per request or sync run) and share these, so connections are
+# reused across requests; close_jira_http_clients() releases them on app shutdown.
+JIRA_HTTP_CLIENT_POOL_SIZE = 32
+# Least recently used first
+_http_clients: OrderedDict[tuple, httpx.AsyncClient] = OrderedDict()
+# Requests currently running on each pooled or evicted client
+_in_flight_requests: dict[httpx.AsyncClient, int] = {}
+# Evicted clients still serving requests; the last request to finish closes them
+_evicted_http_clients: dict[httpx.AsyncClient, asyncio.AbstractEventLoop] = {}
+# Strong references to pending aclose() tasks so they are not garbage-collected
+_closing_tasks: set[asyncio.Task] = set()
+
+
+def _close_evicted_client(client_loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    """Close a client dropped from the pool, on the loop that owns its connections."""
+    if client in _in_flight_requests:
+        _evicted_http_clients[client] = client_loop
+        return
+    if client_loop.is_closed():
+        # Its connections died with the loop; nothing left to await
+        return
+    if client_loop is asyncio.get_running_loop():
+        task = client_loop.create_task(client.aclose())
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
+    else:
+        asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+
+
+async def close_jira_http_clients() -> None:
+    """Close every pooled JIRA HTTP client (called from the app lifespan shutdown)."""
+    loop = asyncio.get_running_loop()
+    clients = [(key[0], client) for key, client in _http_clients.items()]
+    clients.extend((client_loop, client) for client, client_loop in _evicted_http_clients.items())
+    _http_clients.clear()
+    _evicted_http_clients.clear()
+    _in_flight_requests.clear()
+
+    for client_loop, client in clients:
+        if client_loop is loop:
+            await client.aclose()
+        else:
+            _close_evicted_client(client_loop, client)
+    if _closing_tasks:
+        await asyncio.gather(*_closing_tasks, return_exceptions=True)
 
 
 class JiraClient:
@@ -27,20 +82,45 @@ class JiraClient:
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
-    
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for this instance's URL and credentials."""
+        loop = asyncio.get_running_loop()
+        key = (loop, self.base_url, self.headers["Authorization"])
+        client = _http_clients.get(key)
+        if client is not None and not client.is_closed:
+            _http_clients.move_to_end(key)
+            return client
+
+        _http_clients.pop(key, None)
+        # Clients of loops that have since closed are unusable: drop them before live ones
+        for stale_key in [k for k in _http_clients if k[0].is_closed()]:
+            _close_evicted_client(stale_key[0], _http_clients.pop(stale_key))
+        while len(_http_clients) >= JIRA_HTTP_CLIENT_POOL_SIZE:
+            old_key, old_client = _http_clients.popitem(last=False)
+            _close_evicted_client(old_key[0], old_client)
+
+        client = _http_clients[key] = httpx.AsyncClient(
+            base_url=f"{self.base_url}/rest/api/3",
+            headers=self.headers,
+            timeout=30.0
+        )
+        return client
+
     async def _request(self, method: str, endpoint: str, **kwargs) -> dict:
         """Make an authenticated request to JIRA API."""
-        url = f"{self.base_url}/rest/api/3{endpoint}"
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.request(
-                method,
-                url,
-                headers=self.headers,
-                **kwargs
-            )
-            response.raise_for_status()
-            return response.json()
+        client = self._get_client()
+        _in_flight_requests[client] = _in_flight_requests.get(client, 0) + 1
+        try:
+            response = await client.request(method, endpoint, **kwargs)
+        finally:
+            remaining = _in_flight_requests.pop(client, 1) - 1
+            if remaining:
+                _in_flight_requests[client] = remaining
+            elif _evicted_http_clients.pop(client, None) is not None:
+                await client.aclose()
+        response.raise_for_status()
+        return response.json()
 
     async def test_connection(self) -> dict:
         """
@@ -61,13 +141,13 @@ class JiraClient:
         Returns the accountId if found, None otherwise.
         """
         try:
-            print(f"[JiraClient] Searching for user '{email}' on instance '{self.instance.name}' at URL: {self.base_url}")
+            logger.debug("Searching for user '%s' on instance '%s' at URL: %s", email, self.instance.name, self.base_url)
             result = await self._request(
                 "GET",
                 "/user/search",
                 params={"query": email}
             )
-            print(f"[JiraClient] Found {len(result)} results from {self.instance.name}")
+            logger.debug("Found %d results from %s", len(result), self.instance.name)
 
             # Find exact match by email (case insensitive)
             for user in result:
@@ -81,7 +161,7 @@ class JiraClient:
 
             return None
         except httpx.HTTPError as e:
-            print(f"Error searching user {email}: {e}")
+            logger.warning("Error searching user %s: %s", email, e)
             return None
 
     async def get_projects(self) -> list[dict]:
@@ -90,7 +170,7 @@ class JiraClient:
             result = await self._request("GET", "/project")
             return [{"key": p["key"], "name": p["name"], "id": p.get("id")} for p in result]
         except httpx.HTTPError as e:
-            print(f"Error fetching projects from {self.instance.name}: {e}")
+            logger.warning("Error fetching projects from %s: %s", self.instance.name, e)
             return []
 
     async def get_all_issue_types(self) -> list[dict]:
@@ -102,7 +182,7 @@ class JiraClient:
                 for it in result
             ]
         except httpx.HTTPError as e:
-            print(f"Error fetching issue types from {self.instance.name}: {e}")
+            logger.warning("Error fetching issue types from %s: %s", self.instance.name, e)
             return []
 
     async def get_issue_types_for_project(self, project_key: str) -> list[dict]:
@@ -129,7 +209,7 @@ class JiraClient:
                     for it in result
                 ]
             except httpx.HTTPError as e:
-                print(f"Error fetching issue types from {self.instance.name}: {e}")
+                logger.warning("Error fetching issue types from %s: %s", self.instance.name, e)
                 return []
 
     async def create_issue(
@@ -191,7 +271,7 @@ class JiraClient:
         start_at = 0
         max_results = 50
         
-        print(f"Fetching users from {self.instance.name}...")
+        logger.info("Fetching users from %s...", self.instance.name)
         
         while True:
             try:
@@ -220,10 +300,10 @@ class JiraClient:
                 start_at += max_results
                 
             except httpx.HTTPError as e:
-                print(f"Error fetching users: {e}")
+                logger.warning("Error fetching users from %s: %s", self.instance.name, e)
                 break
                 
-        print(f"Found {len(user_map)} users with emails")
+        logger.info("Found %d users with emails", len(user_map))
         return user_map
     
     async def get_worklogs_for_issue(self, issue_key: str) -> list[dict]:
@@ -232,7 +312,7 @@ class JiraClient:
             result = await self._request("GET", f"/issue/{issue_key}/worklog")
             return result.get("worklogs", [])
         except httpx.HTTPError as e:
-            print(f"Error fetching worklogs for {issue_key}: {e}")
+            logger.warning("Error fetching worklogs for %s: %s", issue_key, e)
             return []
     
     async def search_issues_with_worklogs(
@@ -276,7 +356,7 @@ class JiraClient:
                 start_at += max_results
                 
             except httpx.HTTPError as e:
-                print(f"Error searching issues: {e}")
+                logger.warning("Error searching issues: %s", e)
                 break
         
         return all_issues
@@ -303,7 +383,7 @@ class JiraClient:
         result_map = {}
         unique_ids = list(set(issue_ids))
 
-        print(f"Fetching details for {len(unique_ids)} issues from JIRA...")
+        logger.info("Fetching details for %d issues from %s...", len(unique_ids), self.instance.name)
 
         # Fetch each issue individually (JQL search by ID doesn't work in some JIRA versions)
         for issue_id in unique_ids:
@@ -362,10 +442,10 @@ class JiraClient:
                 }
 
             except httpx.HTTPError as e:
-                print(f"Error fetching issue {issue_id}: {e}")
+                logger.warning("Error fetching issue %s: %s", issue_id, e)
                 continue
 
-        print(f"Resolved {len(result_map)} issues")
+        logger.info("Resolved %d issues", len(result_map))
         return result_map
     
     async def get_epics(self, project_keys: Optional[list[str]] = None) -> list[Epic]:
@@ -408,7 +488,7 @@ class JiraClient:
                 start_at += max_results
                 
             except httpx.HTTPError as e:
-                print(f"Error fetching epics: {e}")
+                logger.warning("Error fetching epics from %s: %s", self.instance.name, e)
                 break
         
         return all_epics
@@ -435,13 +515,15 @@ class JiraClient:
             account_id_to_email: Mapping from account ID to email address
         """
         if not user_account_ids:
-            print("No user account IDs provided - skipping worklog fetch (privacy protection)")
+            logger.info("No user account IDs provided - skipping worklog fetch (privacy protection)")
             return []
         
         account_id_to_email = account_id_to_email or {}
         
-        print(f"Fetching JIRA worklogs from {self.instance.name} for {start_date} to {end_date}...")
-        print(f"  Fetching for {len(user_account_ids)} users using per-user JQL")
+        logger.info(
+            "Fetching JIRA worklogs from %s for %s to %s (%d users, per-user JQL)",
+            self.instance.name, start_date, end_date, len(user_account_ids)
+        )
         
         all_worklogs = []
         
@@ -451,7 +533,7 @@ class JiraClient:
             )
             all_worklogs.extend(user_worklogs)
         
-        print(f"Total JIRA worklogs fetched: {len(all_worklogs)}")
+        logger.info("Total JIRA worklogs fetched from %s: %d", self.instance.name, len(all_worklogs))
         return all_worklogs
     
     async def _get_worklogs_for_user(
@@ -567,14 +649,14 @@ class JiraClient:
                         all_worklogs.append(worklog)
                         
                 except httpx.HTTPError as e:
-                    print(f"Error fetching worklogs for issue {issue_key}: {e}")
+                    logger.warning("Error fetching worklogs for issue %s: %s", issue_key, e)
                     continue
                     
         except httpx.HTTPError as e:
-            print(f"Error searching issues for user {account_id}: {e}")
+            logger.warning("Error searching issues for user %s: %s", account_id, e)
         
         if all_worklogs:
-            print(f"  User {account_id}: {len(all_worklogs)} worklogs")
+            logger.debug("User %s: %d worklogs", account_id, len(all_worklogs))
         
         return all_worklogs
 
@@ -598,7 +680,7 @@ class JiraService:
         cache_key = f"worklogs_{start_date}_{end_date}_{','.join(sorted(user_emails or []))}"
         cached = await self.cache.get_query_cache(cache_key)
         if cached:
-            return [Worklog(**w) for w in cached]
+            return WORKLOG_LIST_ADAPTER.validate_python(cached)
         
         # Fetch from all instances in parallel
         tasks = [
@@ -615,7 +697,7 @@ class JiraService:
         # Cache the results
         await self.cache.set_query_cache(
             cache_key, 
-            [w.model_dump(mode="json") for w in all_worklogs]
+            WORKLOG_LIST_ADAPTER.dump_python(all_worklogs, mode="json")
         )
         
         return all_worklogs
@@ -625,7 +707,7 @@ class JiraService:
         cache_key = "all_epics"
         cached = await self.cache.get_query_cache(cache_key)
         if cached:
-            return [Epic(**e) for e in cached]
+            return EPIC_LIST_ADAPTER.validate_python(cached)
         
         tasks = [client.get_epics() for client in self.clients]
         results = await asyncio.gather(*tasks)
@@ -636,7 +718,7 @@ class JiraService:
         
         await self.cache.set_query_cache(
             cache_key,
-            [e.model_dump(mode="json") for e in all_epics]
+            EPIC_LIST_ADAPTER.dump_python(all_epics, mode="json")
         )
         
         return all_epics
@@ -3,21 +3,32 @@ JIRA Worklog Dashboard - FastAPI Backend
 Main application entry point.
 """
 import os
+import sys
 import time
-import json
+import asyncio
+from time import perf_counter
+import orjson
 import traceback
+from collections import defaultdict
 from pathlib import Path
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Depends
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.exception_handlers import http_exception_handler
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.datastructures import Headers, QueryParams
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from .config import get_config, DEMO_CONFIG, get_teams_from_db, get_users_from_db
-from .cache import get_storage
+from .config import (
+    get_config, DEMO_CONFIG, get_teams_from_db, get_users_from_db,
+    get_cached_config_info, set_cached_config_info, invalidate_config_info
+)
+from .cache import get_storage, get_cache
 from .database import db
+from .jira_client import close_jira_http_clients
 from .routers import dashboard, teams, users, epics, sync, settings, logs, issues, packages, billing, factorial, auth, invitations, worklogs
 from .auth.dependencies import get_current_user, CurrentUser
 from .middleware.company_context import CompanyContextMiddleware
@@ -27,6 +38,50 @@ from .logging_config import (
 )
 
 
+# ============================================================================
+# BACKGROUND LOG FLUSHING
+# ============================================================================
+
+LOG_FLUSH_INTERVAL = 0.2    # Seconds between flushes
+LOG_FLUSH_MAX_ROWS = 500    # Max rows per INSERT batch
+LOG_QUEUE_MAX_BATCHES = 1000  # Oldest batches are dropped beyond this
+
+# Per-request log batches waiting to be written by the flusher task
+_log_queue: asyncio.Queue = asyncio.Queue(maxsize=LOG_QUEUE_MAX_BATCHES)
+
+
+def enqueue_logs(logs: list[dict]) -> None:
+    """Queue a batch of log entries for the background flusher (never blocks)."""
+    try:
+        _log_queue.put_nowait(logs)
+    except asyncio.QueueFull:
+        # Drop the oldest batch rather than apply backpressure to requests
+        _log_queue.get_nowait()
+        _log_queue.put_nowait(logs)
+
+
+async def flush_log_queue(storage=None) -> int:
+    """Write all queued log entries to storage. Returns count flushed."""
+    storage = storage or get_storage()
+    flushed = 0
+    while not _log_queue.empty():
+        pending = []
+        while not _log_queue.empty() and len(pending) < LOG_FLUSH_MAX_ROWS:
+            pending.extend(_log_queue.get_nowait())
+        try:
+            flushed += await storage.insert_logs_batch(pending)
+        except Exception as e:
+            sys.stderr.write(f"Warning: failed to flush {len(pending)} log entries: {e}\n")
+    return flushed
+
+
+async def _log_flusher(storage) -> None:
+    """Periodically drain the log queue into a single batch INSERT."""
+    while True:
+        await asyncio.sleep(LOG_FLUSH_INTERVAL)
+        await flush_log_queue(storage)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler - runs on startup and shutdown."""
@@ -47,8 +102,8 @@ async def lifespan(app: FastAPI):
         if config.settings.demo_mode:
             logger.info("Running in DEMO MODE with sample data")
         else:
-            logger.info(f"Loaded configuration with {len(config.jira_instances)} JIRA instance(s)")
-            logger.info(f"Configured {len(config.teams)} team(s) from config")
+            logger.info("Loaded configuration with %d JIRA instance(s)", len(config.jira_instances))
+            logger.info("Configured %d team(s) from config", len(config.teams))
     except FileNotFoundError:
         logger.warning("No config.yaml found - running in DEMO MODE")
         # Force demo mode by setting environment variable
@@ -59,145 +114,223 @@ async def lifespan(app: FastAPI):
     await storage.initialize()
     logger.info("Storage initialized")
 
+    flush_task = asyncio.create_task(_log_flusher(storage))
+
     yield
 
     # Shutdown
     logger.info("Shutting down...")
+    await close_jira_http_clients()
+    flush_task.cancel()
+    try:
+        await flush_task
+    except asyncio.CancelledError:
+        pass
+    await flush_log_queue(storage)
     await db.disconnect()
     logger.info("Database connection pool closed")
 
 
+class DefaultJSONResponse(ORJSONResponse):
+    """orjson-backed default response; keeps int dict keys working like json.dumps did."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Create FastAPI application
 app = FastAPI(
     title="JIRA Worklog Dashboard",
     description="Dashboard per visualizzare i worklog JIRA con supporto multi-team e multi-istanza",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse
 )
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all requests and responses."""
+# Raw ASGI header names (ASGI requires lowercased bytes)
+_REQUEST_ID_HEADER = b"x-request-id"
+_CONTENT_TYPE_HEADER = b"content-type"
+
+# Endpoints polled often enough that logging them is pure noise
+_SKIP_LOGGING_PATHS = frozenset({"/api/health", "/api/logs"})
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware to log all requests and responses.
+
+    Wraps ``send`` to observe the status line and response body instead of
+    going through BaseHTTPMiddleware, which spawns a task group and a
+    streaming response wrapper for every request.
+    """
 
     MAX_BODY_SIZE = 10000  # Max 10KB for body capture
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.logger = get_logger("http")
+        # The middleware stack is built before lifespan runs setup_logging(),
+        # so the handler is resolved on first use and then kept.
+        self._db_handler = get_db_handler()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate and set request ID
         request_id = generate_request_id()
         request_id_var.set(request_id)
+        request_id_bytes = request_id.encode("ascii")
 
-        # Skip logging for certain endpoints to reduce noise
-        skip_logging = request.url.path in ["/api/health", "/api/logs"]
+        method = scope["method"]
+        path = scope["path"]
 
-        start_time = time.time()
-        logger = get_logger("http")
+        # Skip logging for certain endpoints to reduce noise: only tag the
+        # response with the request ID and bypass all capture work.
+        if path in _SKIP_LOGGING_PATHS:
+            async def send_passthrough(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (_REQUEST_ID_HEADER, request_id_bytes)
+                    ]
+                await send(message)
 
-        # Capture request body for POST/PUT/PATCH/DELETE
-        request_body = None
+            await self.app(scope, receive, send_passthrough)
+            return
+
+        start_time = perf_counter()
+        logger = self.logger
+
+        # Capture query params
         query_params = None
-        if not skip_logging:
-            # Capture query params
-            if request.query_params:
-                query_params = dict(request.query_params)
+        if scope.get("query_string"):
+            query_params = dict(QueryParams(scope["query_string"]))
+
+        # Capture request body for POST/PUT/PATCH/DELETE by teeing ``receive``
+        # as the endpoint consumes it; nothing is read if the endpoint never does.
+        capture_request = method in _BODY_METHODS
+        request_body_bytes = bytearray()
+        request_body_truncated = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal capture_request, request_body_truncated
+            message = await receive()
+            if capture_request and message["type"] == "http.request":
+                body = message.get("body", b"")
+                remaining = self.MAX_BODY_SIZE - len(request_body_bytes)
+                if len(body) > remaining:
+                    # Keep only the first MAX_BODY_SIZE bytes, never the full body
+                    request_body_bytes.extend(body[:remaining])
+                    request_body_truncated = True
+                    capture_request = False
+                else:
+                    request_body_bytes.extend(body)
+            return message
+
+        # Log request
+        logger.info("Request: %s %s", method, path)
+
+        status_code = 500
+        capture_response = False
+        response_body_bytes = bytearray()
+
+        async def send_wrapper(message: Message) -> None:
+            # Tee the response: every message is forwarded unchanged while
+            # JSON bodies are copied into a capture buffer up to MAX_BODY_SIZE.
+            nonlocal status_code, capture_response
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                raw_headers = list(message.get("headers", ()))
+                for name, value in raw_headers:
+                    if name == _CONTENT_TYPE_HEADER:
+                        capture_response = b"application/json" in value
+                        break
+                # Add request ID to response headers
+                raw_headers.append((_REQUEST_ID_HEADER, request_id_bytes))
+                message["headers"] = raw_headers
+            elif message["type"] == "http.response.body" and capture_response:
+                body = message.get("body", b"")
+                if len(response_body_bytes) + len(body) < self.MAX_BODY_SIZE:
+                    response_body_bytes.extend(body)
+                else:
+                    # Too large to log: stop capturing and drop what we have
+                    capture_response = False
+                    response_body_bytes.clear()
+            await send(message)
 
-            # Capture request body
-            if request.method in ["POST", "PUT", "PATCH", "DELETE"]:
-                try:
-                    body_bytes = await request.body()
-                    if body_bytes and len(body_bytes) < self.MAX_BODY_SIZE:
-                        content_type = request.headers.get("content-type", "")
-                        if "application/json" in content_type:
-                            try:
-                                request_body = json.loads(body_bytes)
-                            except json.JSONDecodeError:
-                                request_body = body_bytes.decode("utf-8", errors="replace")
-                        else:
-                            request_body = body_bytes.decode("utf-8", errors="replace")
-                except Exception:
-                    pass  # Ignore body capture errors
-
-        # Log request (unless skipped)
-        if not skip_logging:
-            logger.info(f"Request: {request.method} {request.url.path}")
-
-        # Process request and capture response body
-        response_body = None
         try:
-            response = await call_next(request)
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Capture response body if JSON and small enough
-            if not skip_logging:
-                content_type = response.headers.get("content-type", "")
-                if "application/json" in content_type:
-                    # Read the response body
-                    response_body_bytes = b""
-                    async for chunk in response.body_iterator:
-                        response_body_bytes += chunk
-
-                    if len(response_body_bytes) < self.MAX_BODY_SIZE:
-                        try:
-                            response_body = json.loads(response_body_bytes)
-                        except json.JSONDecodeError:
-                            pass
-
-                    # Recreate the response with the captured body
-                    response = Response(
-                        content=response_body_bytes,
-                        status_code=response.status_code,
-                        headers=dict(response.headers),
-                        media_type=response.media_type
-                    )
-
-            # Log response
-            if not skip_logging:
-                logger.info(
-                    f"Response: {request.method} {request.url.path} - {response.status_code} ({duration_ms:.1f}ms)"
-                )
-
-            # Flush logs to database
-            db_handler = get_db_handler()
-            if db_handler and not skip_logging:
-                buffered_logs = db_handler.get_and_clear_buffer()
-                if buffered_logs:
-                    # Build extra_data with request/response info
-                    extra_data = {}
-                    if query_params:
-                        extra_data["query_params"] = query_params
-                    if request_body is not None:
-                        extra_data["request_body"] = request_body
-                    if response_body is not None:
-                        extra_data["response_body"] = response_body
-
-                    # Enrich with request info
-                    for log in buffered_logs:
-                        log["endpoint"] = request.url.path
-                        log["method"] = request.method
-                        log["status_code"] = response.status_code
-                        log["duration_ms"] = duration_ms
-                        if extra_data:
-                            # Merge with existing extra_data if any
-                            existing = log.get("extra_data") or {}
-                            if isinstance(existing, str):
-                                try:
-                                    existing = json.loads(existing)
-                                except:
-                                    existing = {}
-                            log["extra_data"] = {**existing, **extra_data}
-
-                    # Store to database
-                    storage = get_storage()
-                    await storage.insert_logs_batch(buffered_logs)
-
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            return response
-
+            await self.app(scope, receive_wrapper, send_wrapper)
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"Error: {request.method} {request.url.path} - {str(e)}", exc_info=True)
+            duration_ms = (perf_counter() - start_time) * 1000.0
+            logger.error("Error: %s %s - %s (%.1fms)", method, path, e, duration_ms, exc_info=True)
             raise
 
+        duration_ms = (perf_counter() - start_time) * 1000.0
+
+        # Parse captured request body
+        request_body = None
+        if request_body_bytes:
+            content_type = Headers(scope=scope).get("content-type", "")
+            if "application/json" in content_type and not request_body_truncated:
+                try:
+                    request_body = orjson.loads(request_body_bytes)
+                except orjson.JSONDecodeError:
+                    request_body = request_body_bytes.decode("utf-8", errors="replace")
+            else:
+                request_body = request_body_bytes.decode("utf-8", errors="replace")
+
+        # Parse captured response body (only present if JSON and small enough)
+        response_body = None
+        if response_body_bytes:
+            try:
+                response_body = orjson.loads(response_body_bytes)
+            except orjson.JSONDecodeError:
+                pass
+
+        # Log response
+        logger.info("Response: %s %s - %d (%.1fms)", method, path, status_code, duration_ms)
+
+        # Flush logs to database
+        db_handler = self._db_handler
+        if db_handler is None:
+            db_handler = self._db_handler = get_db_handler()
+        if db_handler:
+            buffered_logs = db_handler.get_and_clear_buffer()
+            if buffered_logs:
+                # Build extra_data with request/response info
+                extra_data = {}
+                if query_params:
+                    extra_data["query_params"] = query_params
+                if request_body is not None:
+                    extra_data["request_body"] = request_body
+                    if request_body_truncated:
+                        extra_data["request_body_truncated"] = True
+                if response_body is not None:
+                    extra_data["response_body"] = response_body
+
+                # Enrich with request info
+                for log in buffered_logs:
+                    log["endpoint"] = path
+                    log["method"] = method
+                    log["status_code"] = status_code
+                    log["duration_ms"] = duration_ms
+                    if extra_data:
+                        # Merge with existing extra_data if any
+                        existing = log.get("extra_data") or {}
+                        if isinstance(existing, str):
+                            try:
+                                existing = orjson.loads(existing)
+                            except orjson.JSONDecodeError:
+                                existing = {}
+                        log["extra_data"] = {**existing, **extra_data}
+
+                # Hand off to the background flusher
+                enqueue_logs(buffered_logs)
+
 
 # Add logging middleware (before CORS)
 app.add_middleware(LoggingMiddleware)
@@ -205,21 +338,31 @@ app.add_middleware(LoggingMiddleware)
 # Add company context middleware (after logging, before CORS)
 app.add_middleware(CompanyContextMiddleware)
 
-# Configure CORS for frontend (web and Tauri desktop)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",  # Vite dev server
-        "http://localhost:3000",  # Alternative dev server
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:3000",
-        "tauri://localhost",      # Tauri desktop app
-        "https://tauri.localhost", # Tauri desktop app (alternative)
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Configure CORS for frontend (web and Tauri desktop).
+# Origins are a frozenset so CORSMiddleware's membership check is O(1).
+CORS_ALLOWED_ORIGINS = frozenset({
+    "http://localhost:5173",  # Vite dev server
+    "http://localhost:3000",  # Alternative dev server
+    "http://127.0.0.1:5173",
+    "http://127.0.0.1:3000",
+    "tauri://localhost",      # Tauri desktop app
+    "https://tauri.localhost", # Tauri desktop app (alternative)
+})
+# Only what the API routes and the frontend client actually use
+CORS_ALLOWED_METHODS = ("GET", "POST", "PUT", "DELETE")
+CORS_ALLOWED_HEADERS = ("authorization", "content-type", "x-request-id")
+
+# Same-origin deployments (frontend served from FRONTEND_DIR below) never
+# send cross-origin requests and can drop the middleware entirely.
+if os.getenv("JIRA_DASHBOARD_ENABLE_CORS", "true").lower() == "true":
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ALLOWED_ORIGINS,
+        allow_credentials=True,
+        allow_methods=CORS_ALLOWED_METHODS,
+        allow_headers=CORS_ALLOWED_HEADERS,
+        max_age=86400,  # Let browsers cache preflight results for a day
+    )
 
 # Include routers
 # Auth routers (public - no authentication required)
@@ -245,40 +388,47 @@ app.include_router(worklogs.router)
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Catch all unhandled exceptions and log full traceback."""
+    # HTTP errors raised outside the routing layer (e.g. from middleware)
+    # also land here; answer them normally without traceback or DB row
+    if isinstance(exc, StarletteHTTPException):
+        return await http_exception_handler(request, exc)
+
     logger = get_logger("error")
 
-    # Get full traceback
-    tb_str = traceback.format_exception(type(exc), exc, exc.__traceback__)
-    full_traceback = "".join(tb_str)
+    # Get full traceback (the handler runs inside the except block, so the
+    # exception being handled is still the current one)
+    full_traceback = traceback.format_exc()
 
     # Log with full traceback
     logger.error(
-        f"Unhandled exception on {request.method} {request.url.path}:\n{full_traceback}"
+        "Unhandled exception on %s %s:\n%s", request.method, request.url.path, full_traceback
     )
 
-    # Store error log to database
-    try:
-        storage = get_storage()
-        await storage.insert_logs_batch([{
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "level": "ERROR",
-            "logger_name": "error",
-            "message": f"Unhandled exception: {str(exc)}",
-            "request_id": request_id_var.get(""),
-            "endpoint": request.url.path,
-            "method": request.method,
-            "status_code": 500,
-            "extra_data": {"traceback": full_traceback}
-        }])
-    except Exception:
-        pass  # Don't fail if logging fails
-
-    return JSONResponse(
+    # Queue error log for the background flusher so the 500 is returned
+    # immediately, even when the database itself is what failed
+    enqueue_logs([{
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "level": "ERROR",
+        "logger_name": "error",
+        "message": f"Unhandled exception: {str(exc)}",
+        "request_id": request_id_var.get(""),
+        "endpoint": request.url.path,
+        "method": request.method,
+        "status_code": 500,
+        "extra_data": {"traceback": full_traceback}
+    }])
+
+    return ORJSONResponse(
         status_code=500,
         content={"detail": f"Internal server error: {str(exc)}"}
     )
 
 
+# Pre-encoded healthy /api/health bodies keyed by (demo_mode, jira_instances).
+# The key covers every variable field, so entries never need invalidation.
+_health_payloads: dict[tuple[bool, int], bytes] = {}
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
@@ -288,12 +438,16 @@ async def health_check():
             await conn.fetchval("SELECT 1")
 
         config = get_config()
-        return {
-            "status": "healthy",
-            "database": "connected",
-            "demo_mode": config.settings.demo_mode,
-            "jira_instances": len(config.jira_instances)
-        }
+        key = (config.settings.demo_mode, len(config.jira_instances))
+        payload = _health_payloads.get(key)
+        if payload is None:
+            payload = _health_payloads[key] = orjson.dumps({
+                "status": "healthy",
+                "database": "connected",
+                "demo_mode": key[0],
+                "jira_instances": key[1]
+            })
+        return Response(content=payload, media_type="application/json")
     except FileNotFoundError:
         return {
             "status": "healthy",
@@ -312,18 +466,45 @@ async def health_check():
 @app.get("/api/config")
 async def get_config_info(current_user: CurrentUser = Depends(get_current_user)):
     """Get non-sensitive configuration info (scoped to company)."""
+    storage = get_storage()
+
+    # Company-scoped part is cached briefly; the user part is always fresh
+    company_info = get_cached_config_info(current_user.company_id)
+    if company_info is None:
+        company_info = await _build_company_config_info(current_user.company_id)
+        set_cached_config_info(current_user.company_id, company_info)
+
+    # Get current user details from database
+    current_user_data = await storage.get_user(current_user.id, current_user.company_id)
+    user_info = {
+        "id": current_user.id,
+        "email": current_user.email,
+        "role": current_user.role,
+        "name": f"{current_user_data.get('first_name', '')} {current_user_data.get('last_name', '')}".strip() if current_user_data else None,
+        "first_name": current_user_data.get("first_name") if current_user_data else None,
+        "last_name": current_user_data.get("last_name") if current_user_data else None,
+    }
+
+    return {**company_info, "user": user_info}
+
+
+async def _build_company_config_info(company_id: int) -> dict:
+    """Assemble the company-scoped part of the /api/config payload."""
     try:
         config = get_config()
     except FileNotFoundError:
         config = DEMO_CONFIG
 
-    # Get teams and users from database (scoped to company)
-    teams = await get_teams_from_db(current_user.company_id)
-    users = await get_users_from_db(current_user.company_id)
-
-    # Get JIRA instances from database only (no fallback to config.yaml)
+    # Get teams, users and JIRA instances from database (scoped to company).
+    # The queries are independent and each opens its own connection, so run
+    # them concurrently. JIRA instances come from the database only (no
+    # fallback to config.yaml).
     storage = get_storage()
-    db_instances = await storage.get_all_jira_instances(current_user.company_id)
+    teams, users, db_instances = await asyncio.gather(
+        get_teams_from_db(company_id),
+        get_users_from_db(company_id),
+        storage.get_all_jira_instances(company_id)
+    )
 
     jira_instances = [
         {"name": inst["name"], "url": inst["url"]}
@@ -331,28 +512,15 @@ async def get_config_info(current_user: CurrentUser = Depends(get_current_user))
     ]
 
     # Group users by team
-    team_members = {}
+    team_members = defaultdict(list)
     for user in users:
         team_name = user.get("team_name")
         if team_name:
-            if team_name not in team_members:
-                team_members[team_name] = []
             team_members[team_name].append({
                 "email": user["email"],
-                "full_name": f"{user['first_name']} {user['last_name']}"
+                "full_name": user["first_name"] + " " + user["last_name"]
             })
 
-    # Get current user details from database
-    current_user_data = await storage.get_user(current_user.id, current_user.company_id)
-    user_info = {
-        "id": current_user.id,
-        "email": current_user.email,
-        "role": current_user.role,
-        "name": f"{current_user_data.get('first_name', '')} {current_user_data.get('last_name', '')}".strip() if current_user_data else None,
-        "first_name": current_user_data.get("first_name") if current_user_data else None,
-        "last_name": current_user_data.get("last_name") if current_user_data else None,
-    }
-
     return {
         "demo_mode": config.settings.demo_mode,
         "daily_working_hours": config.settings.daily_working_hours,
@@ -360,21 +528,23 @@ async def get_config_info(current_user: CurrentUser = Depends(get_current_user))
         "complementary_instances": config.settings.complementary_instances,
         "jira_instances": jira_instances,
         "user_count": len(users),
-        "user": user_info,
         "teams": [
             {
                 "name": team["name"],
-                "member_count": len(team_members.get(team["name"], [])),
-                "members": team_members.get(team["name"], [])
+                "member_count": len(members),
+                "members": members
             }
             for team in teams
+            for members in (team_members.get(team["name"], []),)
         ]
     }
 
 
 @app.post("/api/cache/clear")
 async def clear_cache():
-    """Clear all cached data."""
+    """Clear all cached data and reload config.yaml on next access."""
+    get_config.cache_clear()
+    invalidate_config_info()
     cache = get_cache()
     await cache.clear_all()
     return {"status": "ok", "message": "Cache cleared"}
@@ -412,4 +582,6 @@ if FRONTEND_DIR.exists():
 # Entry point for running as standalone executable (Tauri sidecar)
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000, log_level="info")
+    # uvloop/httptools ship with uvicorn[standard] but uvloop has no Windows build
+    fast_loop = {"loop": "uvloop", "http": "httptools"} if sys.platform != "win32" else {}
+    uvicorn.run(app, host="127.0.0.1", port=8000, log_level="info", **fast_loop)
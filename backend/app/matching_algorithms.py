@@ -7,11 +7,57 @@ via settings.
 """
 
 import re
+import sys
 from collections import defaultdict
-from typing import List, Dict, Set, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Callable, Iterator, Mapping, Optional, Tuple
 from dataclasses import dataclass
 
 
+# JIRA issue key pattern (PROJ-123), compiled once at import
+_ISSUE_KEY_RE = re.compile(r'[A-Z][A-Z0-9]+-\d+')
+_ISSUE_KEY_EXACT_RE = re.compile(r'^[A-Z][A-Z0-9]+-\d+$')
+
+
+def _find_first_key(text: str) -> Optional[str]:
+    """Return the first PROJ-123 key in text, or None.
+
+    Every key contains '-', so text without one (most free-form summaries)
+    is rejected with a single C-level scan before touching the regex engine.
+    """
+    if '-' not in text:
+        return None
+    match = _ISSUE_KEY_RE.search(text)
+    return match.group(0) if match else None
+
+
+@lru_cache(maxsize=64)
+def _build_exclusion_matcher(exclusions: tuple) -> Callable[[str], bool]:
+    """
+    Compile exclusion patterns into a single predicate.
+
+    Patterns in practice are literal ('ADMIN') or 'PREFIX-*', so those are
+    split into an exact-match frozenset and a prefix tuple for str.startswith.
+    Any other wildcard shape ('A*B', '*') falls back to one fused regex.
+    """
+    exact = frozenset(p for p in exclusions if '*' not in p)
+    prefixes = tuple(p[:-1] for p in exclusions if p.endswith('*') and p.count('*') == 1)
+    others = [p for p in exclusions if '*' in p and not (p.endswith('*') and p.count('*') == 1)]
+
+    fullmatch = None
+    if others:
+        joined = '|'.join(re.escape(p).replace(r'\*', '.*') for p in others)
+        fullmatch = re.compile(f'(?:{joined})').fullmatch
+
+    def is_excluded(linking_key: str) -> bool:
+        if linking_key in exact or linking_key.startswith(prefixes):
+            return True
+        return fullmatch is not None and fullmatch(linking_key) is not None
+
+    return is_excluded
+
+
 def _matches_exclusion_pattern(linking_key: str, exclusions: List[str]) -> bool:
     """
     Check if linking_key matches any exclusion pattern.
@@ -31,19 +77,76 @@ def _matches_exclusion_pattern(linking_key: str, exclusions: List[str]) -> bool:
     if not exclusions:
         return False
 
-    for pattern in exclusions:
-        if '*' in pattern:
-            # Convert wildcard pattern to regex
-            # 'ASS-*' -> '^ASS-.*$'
-            regex_pattern = pattern.replace('*', '.*')
-            if re.match(f'^{regex_pattern}$', linking_key):
-                return True
-        else:
-            # Exact match
-            if linking_key == pattern:
-                return True
+    return _build_exclusion_matcher(tuple(exclusions))(linking_key)
 
-    return False
+
+@lru_cache(maxsize=8192)
+def _extract_linking_key_cached(
+    issue_key: Optional[str],
+    issue_summary: Optional[str],
+    parent_name: Optional[str],
+    parent_key: Optional[str]
+) -> Optional[str]:
+    """
+    Linking key extraction for ParentLinkingMatcher, memoized per issue.
+
+    Worklogs on the same issue share all four inputs, so the regex work runs
+    once per distinct issue instead of once per worklog. Keys are interned so
+    every group lookup for the same key hits the same string object.
+    """
+    # PRIORITY 1: Extract pattern from parent_name
+    # This captures the "real project key" that links issues across instances
+    if parent_name:
+        key = _find_first_key(parent_name)
+        if key:
+            return sys.intern(key)
+
+    # PRIORITY 2: Extract pattern from issue_summary
+    # Fallback if parent_name doesn't contain a linking key
+    if issue_summary:
+        key = _find_first_key(issue_summary)
+        if key:
+            return sys.intern(key)
+
+    # PRIORITY 3: Use parent_key if it's a complete PROJ-123 pattern
+    # Reject generic parent keys like "DLREQ" (without number)
+    if parent_key and _ISSUE_KEY_EXACT_RE.match(parent_key):
+        return sys.intern(parent_key)
+
+    # PRIORITY 4: Fallback to issue_key
+    # Ensures every worklog has a linking_key, even if no cross-instance match
+    if issue_key:
+        return sys.intern(issue_key)
+
+    return None
+
+
+@dataclass(slots=True, frozen=True)
+class MatchWorklog:
+    """Slim, slotted view of a Worklog with only the fields matching reads."""
+    issue_key: str
+    issue_summary: str
+    author_email: str
+    time_spent_seconds: int
+    issue_type: Optional[str] = None
+    parent_key: Optional[str] = None
+    parent_name: Optional[str] = None
+
+
+def to_match_worklogs(worklogs: List[Any]) -> List[MatchWorklog]:
+    """Convert worklogs once before matching, so hot loops skip model attribute overhead."""
+    return [
+        MatchWorklog(
+            issue_key=wl.issue_key,
+            issue_summary=wl.issue_summary,
+            author_email=wl.author_email,
+            time_spent_seconds=wl.time_spent_seconds,
+            issue_type=wl.issue_type,
+            parent_key=wl.parent_key,
+            parent_name=wl.parent_name,
+        )
+        for wl in worklogs
+    ]
 
 
 @dataclass
@@ -88,6 +191,25 @@ class MatchingAlgorithm:
         Returns:
             Dictionary mapping linking_key -> WorklogGroup
         """
+        return {
+            group.linking_key: group
+            for group in self.iter_groups(
+                primary_worklogs, secondary_worklogs, config, exclusions, generic_issue_codes
+            )
+        }
+
+    def iter_groups(
+        self,
+        primary_worklogs: List[Any],
+        secondary_worklogs: List[Any],
+        config: Dict[str, Any] = None,
+        exclusions: List[str] = None,
+        generic_issue_codes: List[str] = None
+    ) -> Iterator[WorklogGroup]:
+        """
+        Yield groups one at a time, for callers that filter instead of
+        keeping every group. Same arguments as find_groups().
+        """
         raise NotImplementedError
 
 
@@ -114,15 +236,15 @@ class ParentLinkingMatcher(MatchingAlgorithm):
         "Compares aggregated hours per group instead of individual issues."
     )
 
-    def find_groups(
+    def iter_groups(
         self,
         primary_worklogs: List[Any],
         secondary_worklogs: List[Any],
         config: Dict[str, Any] = None,
         exclusions: List[str] = None,
         generic_issue_codes: List[str] = None
-    ) -> Dict[str, WorklogGroup]:
-        """Find groups based on parent linking keys.
+    ) -> Iterator[WorklogGroup]:
+        """Yield groups based on parent linking keys.
 
         Args:
             primary_worklogs: Worklogs from primary instance
@@ -134,65 +256,67 @@ class ParentLinkingMatcher(MatchingAlgorithm):
                                  linking to allow generic issue matching later.
         """
         config = config or {}
-        exclusions = exclusions or []
         generic_issue_codes = set(generic_issue_codes or [])
 
-        # Build groups
-        groups = defaultdict(lambda: {
-            'primary': [],
-            'secondary': []
-        })
+        # Build groups, one flat dict per side
+        primary_groups = defaultdict(list)
+        secondary_groups = defaultdict(list)
+        primary_seconds = defaultdict(int)
+        secondary_seconds = defaultdict(int)
+        primary_issue_keys = defaultdict(set)
+        secondary_issue_keys = defaultdict(set)
+        extract_linking_key = self._extract_linking_key
 
         # Process primary worklogs
         for wl in primary_worklogs:
             # Skip worklogs on generic issues (they'll be processed by apply_generic_issues)
-            if hasattr(wl, 'issue_key') and wl.issue_key in generic_issue_codes:
+            if wl.issue_key in generic_issue_codes:
                 continue
-            linking_key = self._extract_linking_key(wl)
+            linking_key = extract_linking_key(wl)
             if linking_key:
-                groups[linking_key]['primary'].append(wl)
+                primary_groups[linking_key].append(wl)
+                primary_seconds[linking_key] += wl.time_spent_seconds
+                primary_issue_keys[linking_key].add(wl.issue_key)
 
         # Process secondary worklogs (no need to skip - they match by issue_type)
         for wl in secondary_worklogs:
-            linking_key = self._extract_linking_key(wl)
+            linking_key = extract_linking_key(wl)
             if linking_key:
-                groups[linking_key]['secondary'].append(wl)
+                secondary_groups[linking_key].append(wl)
+                secondary_seconds[linking_key] += wl.time_spent_seconds
+                secondary_issue_keys[linking_key].add(wl.issue_key)
 
-        # Build WorklogGroup objects
-        result = {}
-        for linking_key, group_data in groups.items():
-            primary_wls = group_data['primary']
-            secondary_wls = group_data['secondary']
-
-            # Skip groups with ONLY secondary worklogs (MMFG without OT match)
-            # These should remain unmatched for generic issue processing
-            # Only primary-only groups are valid discrepancies (OT hours not tracked in MMFG)
-            if not primary_wls:
-                continue
+        # Resolve exclusion patterns once, outside the per-group loop
+        is_excluded_key = _build_exclusion_matcher(tuple(exclusions or ()))
 
-            # Calculate hours (0 if no worklogs on that side)
-            primary_hours = sum(wl.time_spent_seconds for wl in primary_wls) / 3600 if primary_wls else 0
-            secondary_hours = sum(wl.time_spent_seconds for wl in secondary_wls) / 3600 if secondary_wls else 0
+        # Build WorklogGroup objects
+        # Groups with ONLY secondary worklogs (MMFG without OT match) are never
+        # visited: they remain unmatched for generic issue processing.
+        # Only primary-only groups are valid discrepancies (OT hours not tracked in MMFG)
+        for linking_key, primary_wls in primary_groups.items():
+            secondary_wls = secondary_groups.get(linking_key, [])
+
+            # Hours were accumulated while grouping (0 if no worklogs on that side)
+            primary_hours = primary_seconds[linking_key] / 3600
+            secondary_hours = secondary_seconds.get(linking_key, 0) / 3600
             delta = primary_hours - secondary_hours
 
             # Check if this group is excluded (expected discrepancy like leaves, training)
-            is_excluded = _matches_exclusion_pattern(linking_key, exclusions)
+            is_excluded = is_excluded_key(linking_key)
 
             # Create group (primary required, secondary optional)
-            result[linking_key] = WorklogGroup(
+            yield WorklogGroup(
                 linking_key=linking_key,
                 primary_worklogs=primary_wls,
                 secondary_worklogs=secondary_wls,
                 primary_hours=primary_hours,
                 secondary_hours=secondary_hours,
                 delta=delta,
-                primary_issues=list(set(wl.issue_key for wl in primary_wls)) if primary_wls else [],
-                secondary_issues=list(set(wl.issue_key for wl in secondary_wls)) if secondary_wls else [],
+                primary_issues=list(primary_issue_keys[linking_key]),
+                secondary_issues=list(secondary_issue_keys.get(linking_key, ())),
                 is_excluded=is_excluded
             )
 
-        return result
-
     def _extract_linking_key(self, worklog: Any) -> Optional[str]:
         """
         Extract linking key with intelligent priority to match cross-instance issues.
@@ -224,34 +348,12 @@ class ParentLinkingMatcher(MatchingAlgorithm):
 
             → Both match on "DLREQ-1447" ✅
         """
-        issue_pattern = r'[A-Z][A-Z0-9]+-\d+'
-
-        # PRIORITY 1: Extract pattern from parent_name
-        # This captures the "real project key" that links issues across instances
-        if hasattr(worklog, 'parent_name') and worklog.parent_name:
-            match = re.search(issue_pattern, worklog.parent_name)
-            if match:
-                return match.group(0)
-
-        # PRIORITY 2: Extract pattern from issue_summary
-        # Fallback if parent_name doesn't contain a linking key
-        if hasattr(worklog, 'issue_summary') and worklog.issue_summary:
-            match = re.search(issue_pattern, worklog.issue_summary)
-            if match:
-                return match.group(0)
-
-        # PRIORITY 3: Use parent_key if it's a complete PROJ-123 pattern
-        # Reject generic parent keys like "DLREQ" (without number)
-        if hasattr(worklog, 'parent_key') and worklog.parent_key:
-            if re.match(f'^{issue_pattern}$', worklog.parent_key):
-                return worklog.parent_key
-
-        # PRIORITY 4: Fallback to issue_key
-        # Ensures every worklog has a linking_key, even if no cross-instance match
-        if hasattr(worklog, 'issue_key') and worklog.issue_key:
-            return worklog.issue_key
-
-        return None
+        return _extract_linking_key_cached(
+            worklog.issue_key,
+            worklog.issue_summary,
+            worklog.parent_name,
+            worklog.parent_key,
+        )
 
 
 # Registry of available algorithms
@@ -264,24 +366,26 @@ AVAILABLE_ALGORITHMS = [
 ]
 
 
+@lru_cache(maxsize=None)
 def get_algorithm(algorithm_type: str) -> Optional[MatchingAlgorithm]:
-    """Get algorithm instance by type."""
+    """Get algorithm instance by type (matchers are stateless, so one shared instance)."""
     for algo_class in AVAILABLE_ALGORITHMS:
         if algo_class.algorithm_type == algorithm_type:
             return algo_class()
     return None
 
 
-def get_available_algorithms() -> List[Dict[str, str]]:
-    """Get list of available algorithms with metadata."""
-    return [
-        {
+@lru_cache(maxsize=1)
+def get_available_algorithms() -> Tuple[Mapping[str, str], ...]:
+    """Get available algorithms with metadata (cached, read-only)."""
+    return tuple(
+        MappingProxyType({
             'algorithm_type': algo.algorithm_type,
             'algorithm_name': algo.algorithm_name,
             'description': algo.description,
-        }
+        })
         for algo in AVAILABLE_ALGORITHMS
-    ]
+    )
 
 
 def apply_generic_issues(
@@ -311,14 +415,42 @@ def apply_generic_issues(
     if not generic_issues:
         return matched_groups
 
-    # Collect IDs of worklogs already matched to avoid double-counting
-    matched_primary_ids: Set[Any] = set()
-    matched_secondary_ids: Set[Any] = set()
+    # Preflight: skip all setup when no worklog can hit any rule, i.e. no primary
+    # worklog is on a container issue and no secondary has an allowed issue_type
+    # Secondary issue types are stripped once here and reused by the index below
+    configured_codes = frozenset(gi['issue_code'] for gi in generic_issues)
+    configured_types = frozenset(t.strip() for gi in generic_issues for t in gi['issue_type'].split(','))
+    secondary_types = [wl.issue_type.strip() if wl.issue_type else None for wl in secondary_worklogs]
+    if not any(wl.issue_key in configured_codes for wl in primary_worklogs) and not any(
+        t in configured_types for t in secondary_types
+    ):
+        return matched_groups
+
+    # Flag worklogs already matched to avoid double-counting.
+    # Masks are indexed by position in primary_worklogs/secondary_worklogs.
+    primary_index = {id(wl): i for i, wl in enumerate(primary_worklogs)}
+    secondary_index = {id(wl): i for i, wl in enumerate(secondary_worklogs)}
+    matched_primary_mask = bytearray(len(primary_worklogs))
+    matched_secondary_mask = bytearray(len(secondary_worklogs))
     for group in matched_groups.values():
         for wl in group.primary_worklogs:
-            matched_primary_ids.add(id(wl))
+            i = primary_index.get(id(wl))
+            if i is not None:
+                matched_primary_mask[i] = 1
         for wl in group.secondary_worklogs:
-            matched_secondary_ids.add(id(wl))
+            i = secondary_index.get(id(wl))
+            if i is not None:
+                matched_secondary_mask[i] = 1
+
+    # Index candidate positions once so each rule only visits its own
+    # container issue (primary) and its allowed issue types (secondary)
+    primary_by_key = defaultdict(list)
+    for i, wl in enumerate(primary_worklogs):
+        primary_by_key[wl.issue_key].append(i)
+    secondary_by_type = defaultdict(list)
+    for i, issue_type in enumerate(secondary_types):
+        if issue_type is not None:
+            secondary_by_type[issue_type].append(i)
 
     # Separate team-specific rules from global (team_id=None) rules
     # Team-specific rules take priority over global ones
@@ -326,36 +458,60 @@ def apply_generic_issues(
     global_rules = [gi for gi in generic_issues if gi.get('team_id') is None]
 
     # Track secondary worklogs claimed by team-specific rules
-    claimed_secondary_ids: Set[Any] = set()
+    claimed_secondary_mask = bytearray(len(secondary_worklogs))
+
+    # Lowercased author emails by position, for the team filter
+    primary_emails: List[str] = []
+    secondary_emails: List[str] = []
+    if team_specific:
+        primary_emails = [(wl.author_email or '').lower() for wl in primary_worklogs]
+        secondary_emails = [(wl.author_email or '').lower() for wl in secondary_worklogs]
 
     # Process team-specific rules first (they take priority)
     for gi in team_specific:
         _apply_single_generic_issue(
             gi, matched_groups, primary_worklogs, secondary_worklogs,
-            user_to_team, matched_primary_ids, matched_secondary_ids,
-            claimed_secondary_ids, team_filter=gi['team_id']
+            primary_by_key, secondary_by_type, primary_emails, secondary_emails,
+            user_to_team, matched_primary_mask, matched_secondary_mask,
+            claimed_secondary_mask, team_filter=gi['team_id']
         )
 
     # Process global rules (only for unclaimed worklogs)
     for gi in global_rules:
         _apply_single_generic_issue(
             gi, matched_groups, primary_worklogs, secondary_worklogs,
-            user_to_team, matched_primary_ids, matched_secondary_ids,
-            claimed_secondary_ids, team_filter=None
+            primary_by_key, secondary_by_type, primary_emails, secondary_emails,
+            user_to_team, matched_primary_mask, matched_secondary_mask,
+            claimed_secondary_mask, team_filter=None
         )
 
     return matched_groups
 
 
+def _unique_issue_keys(worklogs: List[Any]) -> List[str]:
+    """Distinct issue keys in first-seen order, skipping dedup when all share one key."""
+    if not worklogs:
+        return []
+    first_key = worklogs[0].issue_key
+    for wl in worklogs:
+        if wl.issue_key != first_key:
+            return list(dict.fromkeys(wl.issue_key for wl in worklogs))
+    return [first_key]
+
+
 def _apply_single_generic_issue(
     gi: Dict[str, Any],
     matched_groups: Dict[str, WorklogGroup],
     primary_worklogs: List[Any],
     secondary_worklogs: List[Any],
+    primary_by_key: Dict[str, List[int]],
+    secondary_by_type: Dict[str, List[int]],
+    primary_emails: List[str],
+    secondary_emails: List[str],
     user_to_team: Dict[str, int],
-    matched_primary_ids: Set[Any],
-    matched_secondary_ids: Set[Any],
-    claimed_secondary_ids: Set[Any],
+    matched_primary_mask: bytearray,
+    matched_secondary_mask: bytearray,
+    claimed_secondary_mask: bytearray,
     team_filter: Optional[int]
 ) -> None:
     """Apply a single generic issue rule, mutating matched_groups in place."""
@@ -363,51 +519,40 @@ def _apply_single_generic_issue(
     issue_type_config = gi['issue_type']
 
     # Support multiple issue types separated by comma (e.g., "Incident,Request,Bug")
-    allowed_types = [t.strip() for t in issue_type_config.split(',')]
-
-    # Find primary worklogs on the container issue (not already matched)
-    primary_matches = []
-    for wl in primary_worklogs:
-        if id(wl) in matched_primary_ids:
-            continue
-        if not hasattr(wl, 'issue_key') or wl.issue_key != issue_code:
-            continue
-        # Apply team filter if set
-        if team_filter is not None:
-            email = getattr(wl, 'author_email', '').lower()
-            if user_to_team.get(email) != team_filter:
-                continue
-        primary_matches.append(wl)
-
-    # Find secondary worklogs with matching issue_type (not already matched or claimed)
-    secondary_matches = []
-    for wl in secondary_worklogs:
-        if id(wl) in matched_secondary_ids:
-            continue
-        if id(wl) in claimed_secondary_ids:
-            continue
-        # Check if worklog's issue_type matches any of the allowed types
-        if not hasattr(wl, 'issue_type') or not wl.issue_type:
-            continue
-        if wl.issue_type.strip() not in allowed_types:
-            continue
-        # Apply team filter if set
-        if team_filter is not None:
-            email = getattr(wl, 'author_email', '').lower()
-            if user_to_team.get(email) != team_filter:
-                continue
-        secondary_matches.append(wl)
+    allowed_types = frozenset(t.strip() for t in issue_type_config.split(','))
+
+    # Find primary worklogs on the container issue (not already matched),
+    # applying the team filter if set
+    primary_positions = [
+        i for i in primary_by_key.get(issue_code, ())
+        if not matched_primary_mask[i]
+        and (team_filter is None or user_to_team.get(primary_emails[i]) == team_filter)
+    ]
+
+    # Find secondary worklogs with matching issue_type (not already matched or claimed).
+    # Positions are merged across allowed types and sorted to keep input order.
+    candidates = sorted(
+        i for issue_type in allowed_types for i in secondary_by_type.get(issue_type, ())
+    )
+    secondary_positions = [
+        i for i in candidates
+        if not (matched_secondary_mask[i] or claimed_secondary_mask[i])
+        and (team_filter is None or user_to_team.get(secondary_emails[i]) == team_filter)
+    ]
 
     # Only create group if at least one side has worklogs
-    if not primary_matches and not secondary_matches:
+    if not primary_positions and not secondary_positions:
         return
 
+    primary_matches = [primary_worklogs[i] for i in primary_positions]
+    secondary_matches = [secondary_worklogs[i] for i in secondary_positions]
+
     # Mark these worklogs as matched/claimed
-    for wl in primary_matches:
-        matched_primary_ids.add(id(wl))
-    for wl in secondary_matches:
-        matched_secondary_ids.add(id(wl))
-        claimed_secondary_ids.add(id(wl))
+    for i in primary_positions:
+        matched_primary_mask[i] = 1
+    for i in secondary_positions:
+        matched_secondary_mask[i] = 1
+        claimed_secondary_mask[i] = 1
 
     # Build the group with abbreviated linking key
     # Format: "SYSMMFG-3658 (Generic)" instead of "GENERIC_SYSMMFG-3658_Task_Incident_Request_..."
@@ -416,8 +561,8 @@ def _apply_single_generic_issue(
     else:
         linking_key = f"{issue_code} (Generic)"
 
-    primary_hours = sum(wl.time_spent_seconds for wl in primary_matches) / 3600 if primary_matches else 0
-    secondary_hours = sum(wl.time_spent_seconds for wl in secondary_matches) / 3600 if secondary_matches else 0
+    primary_hours = sum(primary_worklogs[i].time_spent_seconds for i in primary_positions) / 3600
+    secondary_hours = sum(secondary_worklogs[i].time_spent_seconds for i in secondary_positions) / 3600
 
     matched_groups[linking_key] = WorklogGroup(
         linking_key=linking_key,
@@ -426,7 +571,7 @@ def _apply_single_generic_issue(
         primary_hours=primary_hours,
         secondary_hours=secondary_hours,
         delta=primary_hours - secondary_hours,
-        primary_issues=list(set(wl.issue_key for wl in primary_matches)) if primary_matches else [],
-        secondary_issues=list(set(wl.issue_key for wl in secondary_matches)) if secondary_matches else [],
+        primary_issues=[issue_code] if primary_matches else [],
+        secondary_issues=_unique_issue_keys(secondary_matches),
         is_excluded=False
     )
@@ -7,7 +7,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
-from ..auth.jwt import verify_token
+from ..auth.jwt import verify_token_cached
 
 
 # Context variable to store company_id for the current request
@@ -29,7 +29,7 @@ class CompanyContextMiddleware(BaseHTTPMiddleware):
 
         if auth_header and auth_header.startswith("Bearer "):
             token = auth_header.split(" ", 1)[1]
-            payload = verify_token(token)
+            payload = verify_token_cached(token)
 
             if payload and "company_id" in payload:
                 # Set company_id in context for this request
@@ -1,9 +1,65 @@
 """
 Pydantic models for the JIRA Worklog Dashboard.
 """
+import sys
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter
+
+__all__ = [
+    # Role System
+    "UserRole", "RoleName", "ExclusionType",
+    # Configuration Models
+    "JiraInstanceConfig", "TeamMemberConfig", "TeamConfig", "SettingsConfig",
+    "AppConfig",
+    # JIRA Data Models
+    "Worklog", "Epic", "Issue", "WORKLOG_LIST_ADAPTER", "EPIC_LIST_ADAPTER",
+    # Settings Models (Database)
+    "UserJiraAccount", "TeamBase", "TeamCreate", "TeamUpdate", "TimestampsMixin",
+    "TeamInDBCore", "TeamInDB", "UserBase", "UserCreate", "UserUpdate", "UserInDBCore",
+    "UserInDB", "TeamWithMembers", "FetchAccountIdRequest",
+    "FetchAccountIdResponse", "ImportConfigResponse", "BulkUserCreateRequest",
+    "BulkUserCreateResult", "BulkUserCreateResponse", "BulkFetchAccountResult",
+    "BulkFetchAccountSummary", "BulkFetchAccountResponse",
+    # Holiday Models
+    "HolidayCreate", "HolidayUpdate", "HolidayInDB",
+    # API Response Models
+    "DailyHours", "TeamHours", "UserHours", "EpicHours", "DashboardResponse",
+    "WorklogColumns", "DailyTrendColumns", "InstanceTrendMatrix", "TeamDetailResponse", "UserDetailResponse", "EpicListResponse",
+    "IssueListItem", "IssueListResponse", "EpicDetailResponse",
+    # Multi-JIRA Overview Models
+    "InstanceOverview", "DiscrepancyItem", "ComplementaryComparison",
+    "MultiJiraOverviewResponse",
+    # Package Templates
+    "PackageTemplateCreate", "PackageTemplateUpdate", "PackageInstanceConfig",
+    "PackageCreateRequest", "PackageChildIssue", "PackageCreateResult", "PackageCreateResponse",
+    # Billing Models
+    "InvoiceStatus", "BillingGroupBy",
+    "BillingClientCreate", "BillingClientUpdate", "BillingClientInDB",
+    "BillingProjectCreate", "BillingProjectUpdate", "BillingProjectInDB",
+    "BillingProjectMappingCreate", "BillingProjectMappingInDB", "BillingRateCreate",
+    "BillingRateInDB", "BillingClassificationCreate", "BillingClassificationBulk",
+    "BillingClassificationInDB", "BillingPreviewLineItem", "BillingPreviewResponse",
+    "InvoiceCreate", "InvoiceLineItemInDB", "InvoiceInDB", "InvoiceListResponse",
+    # Factorial HR Models
+    "FactorialConfigCreate", "UserFactorialAccount", "FactorialLeave",
+    "FetchFactorialIdResponse", "BulkFetchFactorialResult",
+    "BulkFetchFactorialResponse",
+    # Authentication Models
+    "CompanyCreate", "CompanyResponse", "OAuthUserCreate", "OAuthUserResponse",
+    "OAuthUserUpdate", "TokenResponse", "RefreshTokenRequest", "InvitationCreate",
+    "InvitationResponse", "InvitationAccept", "OnboardingRequiredResponse",
+    "CompleteOnboardingRequest", "UpdateProfileRequest", "UpdateCompanyRequest",
+    "DevLoginRequest", "AuthAuditLogEntry", "MatchingAlgorithmUpdate",
+    "JiraExclusionCreate",
+    # Generic Issues Models
+    "GenericIssueCreate", "GenericIssueUpdate", "GenericIssueInDB",
+]
+
+
+# Low-cardinality strings repeated on every row (instance, author, parent type, country, currency):
+# interning keeps one shared object per distinct value
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 # ============ Role System ============
@@ -39,10 +95,17 @@ class UserRole:
         return role
 
 
+# Role and exclusion-type fields are validated as Literal membership instead of a regex pattern
+RoleName = Literal["DEV", "PM", "MANAGER", "ADMIN"]
+ExclusionType = Literal["issue_key", "parent_key"]
+
+
 # ============ Configuration Models ============
 
 class JiraInstanceConfig(BaseModel):
     """Configuration for a single JIRA instance."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     url: str
     email: str
@@ -52,6 +115,8 @@ class JiraInstanceConfig(BaseModel):
 
 class TeamMemberConfig(BaseModel):
     """Configuration for a team member."""
+    model_config = ConfigDict(frozen=True)
+
     email: str
     first_name: str
     last_name: str
@@ -63,12 +128,16 @@ class TeamMemberConfig(BaseModel):
 
 class TeamConfig(BaseModel):
     """Configuration for a team."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     members: list[TeamMemberConfig]
 
 
 class SettingsConfig(BaseModel):
     """Application settings."""
+    model_config = ConfigDict(frozen=True)
+
     daily_working_hours: int = 8
     timezone: str = "Europe/Rome"
     cache_ttl_seconds: int = 900
@@ -93,16 +162,16 @@ class Worklog(BaseModel):
     id: str
     issue_key: str
     issue_summary: str
-    author_email: str
+    author_email: InternedStr
     author_user_id: Optional[int] = None
     author_display_name: str
     time_spent_seconds: int
     started: datetime
-    jira_instance: str
+    jira_instance: InternedStr
     # Parent diretto dell'issue (Epic, Story, Task, o Project come fallback)
     parent_key: Optional[str] = None
     parent_name: Optional[str] = None
-    parent_type: Optional[str] = None  # "Epic", "Story", "Task", "Sub-task", "Project"
+    parent_type: Optional[InternedStr] = None  # "Epic", "Story", "Task", "Sub-task", "Project"
     # Epic (se trovata nella gerarchia)
     epic_key: Optional[str] = None
     epic_name: Optional[str] = None
@@ -119,7 +188,7 @@ class Epic(BaseModel):
     key: str
     name: str
     summary: str
-    jira_instance: str
+    jira_instance: InternedStr
     total_time_seconds: int = 0
     contributors: list[str] = Field(default_factory=list)
     
@@ -133,13 +202,20 @@ class Issue(BaseModel):
     key: str
     summary: str
     epic_key: Optional[str] = None
-    jira_instance: str
+    jira_instance: InternedStr
+
+
+# Batch validators: a whole list goes through pydantic-core in one call
+WORKLOG_LIST_ADAPTER = TypeAdapter(list[Worklog])
+EPIC_LIST_ADAPTER = TypeAdapter(list[Epic])
 
 
 # ============ Settings Models (Database) ============
 
 class UserJiraAccount(BaseModel):
     """JIRA account mapping for a user."""
+    model_config = ConfigDict(frozen=True)
+
     jira_instance: str
     account_id: str
 
@@ -160,18 +236,26 @@ class TeamUpdate(BaseModel):
     owner_id: Optional[int] = None
 
 
-class TeamInDB(TeamBase):
-    """Team model with database fields."""
+class TimestampsMixin(BaseModel):
+    """created_at/updated_at columns; list endpoints use the *Core models without them."""
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class TeamInDBCore(TeamBase):
+    """Team model with database fields, without timestamps."""
     id: int
     owner_id: Optional[int] = None
     owner_email: Optional[str] = None
     owner_first_name: Optional[str] = None
     owner_last_name: Optional[str] = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
     member_count: int = 0
 
 
+class TeamInDB(TeamInDBCore, TimestampsMixin):
+    """Team model with database fields."""
+
+
 class UserBase(BaseModel):
     """Base model for user data."""
     email: str
@@ -190,17 +274,15 @@ class UserUpdate(BaseModel):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     team_id: Optional[int] = None
-    role: Optional[str] = Field(default=None, pattern="^(DEV|PM|MANAGER|ADMIN)$")
+    role: Optional[RoleName] = None
 
 
-class UserInDB(UserBase):
-    """User model with database fields."""
+class UserInDBCore(UserBase):
+    """User model with database fields, without timestamps."""
     id: int
     team_id: Optional[int] = None
     team_name: Optional[str] = None
     is_active: bool = True
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
     jira_accounts: list[UserJiraAccount] = Field(default_factory=list)
 
     @property
@@ -208,6 +290,10 @@ class UserInDB(UserBase):
         return f"{self.first_name} {self.last_name}"
 
 
+class UserInDB(UserInDBCore, TimestampsMixin):
+    """User model with database fields."""
+
+
 class TeamWithMembers(TeamInDB):
     """Team model with member list."""
     members: list[UserInDB] = Field(default_factory=list)
@@ -240,6 +326,8 @@ class BulkUserCreateRequest(BaseModel):
 
 class BulkUserCreateResult(BaseModel):
     """Result for a single user in bulk creation."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     email: str
     success: bool
     error: Optional[str] = None
@@ -292,7 +380,7 @@ class HolidayUpdate(BaseModel):
     name: Optional[str] = None
     is_active: Optional[bool] = None
 
-class HolidayInDB(BaseModel):
+class HolidayInDB(TimestampsMixin):
     """Holiday model with database fields."""
     id: int
     name: str
@@ -300,22 +388,24 @@ class HolidayInDB(BaseModel):
     holiday_type: str
     month: Optional[int] = None
     day: Optional[int] = None
-    country: str = "IT"
+    country: InternedStr = "IT"
     is_active: bool = True
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
 
 
 # ============ API Response Models ============
 
 class DailyHours(BaseModel):
     """Hours logged on a specific day."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     date: date
     hours: float
 
 
 class TeamHours(BaseModel):
     """Hours logged by a team."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     team_name: str
     total_hours: float
     expected_hours: float
@@ -326,6 +416,8 @@ class TeamHours(BaseModel):
 
 class UserHours(BaseModel):
     """Hours logged by a user."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     email: str
     user_id: Optional[int] = None
     full_name: str
@@ -336,6 +428,8 @@ class UserHours(BaseModel):
 
 class EpicHours(BaseModel):
     """Hours logged on a parent initiative (Epic, Project, etc.)."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     epic_key: str  # Actually parent_key (kept for backward compatibility)
     epic_name: str  # Actually parent_name (kept for backward compatibility)
     total_hours: float
@@ -359,6 +453,46 @@ class DashboardResponse(BaseModel):
     active_users: int = 0
 
 
+class WorklogColumns(BaseModel):
+    """Worklogs as parallel per-field lists (column i across all lists is one worklog)."""
+    id: list[str] = Field(default_factory=list)
+    issue_key: list[str] = Field(default_factory=list)
+    issue_summary: list[str] = Field(default_factory=list)
+    author_email: list[str] = Field(default_factory=list)
+    author_user_id: list[Optional[int]] = Field(default_factory=list)
+    author_display_name: list[str] = Field(default_factory=list)
+    time_spent_seconds: list[int] = Field(default_factory=list)
+    started: list[datetime] = Field(default_factory=list)
+    jira_instance: list[str] = Field(default_factory=list)
+    parent_key: list[Optional[str]] = Field(default_factory=list)
+    parent_name: list[Optional[str]] = Field(default_factory=list)
+    parent_type: list[Optional[str]] = Field(default_factory=list)
+    epic_key: list[Optional[str]] = Field(default_factory=list)
+    epic_name: list[Optional[str]] = Field(default_factory=list)
+    issue_type: list[Optional[str]] = Field(default_factory=list)
+
+    @classmethod
+    def from_rows(cls, worklogs: list[Worklog]) -> "WorklogColumns":
+        """Transpose already-validated worklogs, one list per field."""
+        return cls.model_construct(**{
+            name: [getattr(wl, name) for wl in worklogs]
+            for name in cls.model_fields
+        })
+
+
+class DailyTrendColumns(BaseModel):
+    """Daily trend as parallel lists: hours[i] is the total logged on dates[i]."""
+    dates: list[date] = Field(default_factory=list)
+    hours: list[float] = Field(default_factory=list)
+
+
+class InstanceTrendMatrix(BaseModel):
+    """Daily trend per JIRA instance as a matrix: hours[i][j] is instance_names[i] on dates[j]."""
+    instance_names: list[str] = Field(default_factory=list)
+    dates: list[date] = Field(default_factory=list)
+    hours: list[list[float]] = Field(default_factory=list)
+
+
 class TeamDetailResponse(BaseModel):
     """Response for team detail view."""
     team_name: str
@@ -380,8 +514,11 @@ class UserDetailResponse(BaseModel):
     expected_hours: float
     epics: list[EpicHours]
     daily_trend: list[DailyHours]
+    daily_trend_columns: Optional[DailyTrendColumns] = None  # Set instead of daily_trend when ?columnar=true
     daily_trend_by_instance: dict[str, list[DailyHours]] = Field(default_factory=dict)
+    daily_trend_by_instance_soa: Optional[InstanceTrendMatrix] = None  # Set instead of daily_trend_by_instance when ?columnar=true
     worklogs: list[Worklog]
+    worklog_columns: Optional[WorklogColumns] = None  # Set instead of worklogs when ?columnar=true
 
 
 class EpicListResponse(BaseModel):
@@ -392,6 +529,8 @@ class EpicListResponse(BaseModel):
 
 class IssueListItem(BaseModel):
     """An individual issue with aggregated worklog hours."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     issue_key: str
     issue_summary: str
     jira_instance: str
@@ -417,13 +556,17 @@ class EpicDetailResponse(BaseModel):
     total_hours: float
     contributors: list[UserHours]
     daily_trend: list[DailyHours]
+    daily_trend_columns: Optional[DailyTrendColumns] = None  # Set instead of daily_trend when ?columnar=true
     worklogs: list[Worklog]
+    worklog_columns: Optional[WorklogColumns] = None  # Set instead of worklogs when ?columnar=true
 
 
 # ============ Multi-JIRA Overview Models ============
 
 class InstanceOverview(BaseModel):
     """Overview metrics for a single JIRA instance."""
+    model_config = ConfigDict(frozen=True)
+
     instance_name: str
     total_hours: float
     expected_hours: float
@@ -436,6 +579,8 @@ class InstanceOverview(BaseModel):
 
 class DiscrepancyItem(BaseModel):
     """A discrepancy between complementary JIRA instances for an initiative."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     initiative_key: str
     initiative_name: str
     primary_hours: float
@@ -504,11 +649,17 @@ class PackageCreateRequest(BaseModel):
     selected_elements: list[str]
 
 
+class PackageChildIssue(BaseModel):
+    """A child issue created under a package parent."""
+    key: Optional[str] = None
+    summary: str = ""
+
+
 class PackageCreateResult(BaseModel):
     """Result of package creation on a single JIRA instance."""
     jira_instance: str
     parent_key: str
-    children: list[dict]
+    children: list[PackageChildIssue]
     auto_created: bool = False
 
 
@@ -522,7 +673,16 @@ class PackageCreateResponse(BaseModel):
 
 # ============ Billing Models ============
 
-class BillingClientCreate(BaseModel):
+class _DeferredModel(BaseModel):
+    """Base for models only the billing/Factorial endpoints touch: core schema is built on first use, not at import."""
+    model_config = ConfigDict(defer_build=True)
+
+
+# Closed sets, validated as Literal membership instead of free strings
+InvoiceStatus = Literal["DRAFT", "ISSUED", "PAID", "VOID"]
+BillingGroupBy = Literal["project", "user", "issue"]
+
+class BillingClientCreate(_DeferredModel):
     """Request to create a billing client."""
     name: str
     billing_currency: str = "EUR"
@@ -530,7 +690,7 @@ class BillingClientCreate(BaseModel):
     jira_instance_id: Optional[int] = None
 
 
-class BillingClientUpdate(BaseModel):
+class BillingClientUpdate(_DeferredModel):
     """Request to update a billing client."""
     name: Optional[str] = None
     billing_currency: Optional[str] = None
@@ -538,31 +698,31 @@ class BillingClientUpdate(BaseModel):
     jira_instance_id: Optional[int] = None
 
 
-class BillingClientInDB(BaseModel):
+class BillingClientInDB(_DeferredModel):
     """Billing client with database fields."""
     id: int
     name: str
-    billing_currency: str = "EUR"
+    billing_currency: InternedStr = "EUR"
     default_hourly_rate: Optional[float] = None
     jira_instance_id: Optional[int] = None
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
 
 
-class BillingProjectCreate(BaseModel):
+class BillingProjectCreate(_DeferredModel):
     """Request to create a billing project."""
     client_id: int
     name: str
     default_hourly_rate: Optional[float] = None
 
 
-class BillingProjectUpdate(BaseModel):
+class BillingProjectUpdate(_DeferredModel):
     """Request to update a billing project."""
     name: Optional[str] = None
     default_hourly_rate: Optional[float] = None
 
 
-class BillingProjectInDB(BaseModel):
+class BillingProjectInDB(_DeferredModel):
     """Billing project with database fields."""
     id: int
     client_id: int
@@ -570,16 +730,16 @@ class BillingProjectInDB(BaseModel):
     default_hourly_rate: Optional[float] = None
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
-    mappings: list[dict] = Field(default_factory=list)
+    mappings: list["BillingProjectMappingInDB"] = Field(default_factory=list)
 
 
-class BillingProjectMappingCreate(BaseModel):
+class BillingProjectMappingCreate(_DeferredModel):
     """Request to map a JIRA project to a billing project."""
     jira_instance: str
     jira_project_key: str
 
 
-class BillingProjectMappingInDB(BaseModel):
+class BillingProjectMappingInDB(_DeferredModel):
     """Billing project mapping with database fields."""
     id: int
     billing_project_id: int
@@ -588,7 +748,7 @@ class BillingProjectMappingInDB(BaseModel):
     created_at: Optional[str] = None
 
 
-class BillingRateCreate(BaseModel):
+class BillingRateCreate(_DeferredModel):
     """Request to create a billing rate override."""
     billing_project_id: int
     user_email: Optional[str] = None
@@ -598,7 +758,7 @@ class BillingRateCreate(BaseModel):
     valid_to: Optional[date] = None
 
 
-class BillingRateInDB(BaseModel):
+class BillingRateInDB(_DeferredModel):
     """Billing rate with database fields."""
     id: int
     billing_project_id: int
@@ -610,7 +770,7 @@ class BillingRateInDB(BaseModel):
     created_at: Optional[str] = None
 
 
-class BillingClassificationCreate(BaseModel):
+class BillingClassificationCreate(_DeferredModel):
     """Request to classify a worklog as billable/non-billable."""
     worklog_id: str
     is_billable: bool
@@ -618,14 +778,14 @@ class BillingClassificationCreate(BaseModel):
     note: Optional[str] = None
 
 
-class BillingClassificationBulk(BaseModel):
+class BillingClassificationBulk(_DeferredModel):
     """Request to bulk classify worklogs."""
     worklog_ids: list[str]
     is_billable: bool
     note: Optional[str] = None
 
 
-class BillingClassificationInDB(BaseModel):
+class BillingClassificationInDB(_DeferredModel):
     """Billing worklog classification with database fields."""
     id: int
     worklog_id: str
@@ -636,8 +796,10 @@ class BillingClassificationInDB(BaseModel):
     classified_at: Optional[str] = None
 
 
-class BillingPreviewLineItem(BaseModel):
+class BillingPreviewLineItem(_DeferredModel):
     """A line item in the billing preview."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     description: str
     quantity_hours: float
     hourly_rate: float
@@ -646,7 +808,7 @@ class BillingPreviewLineItem(BaseModel):
     metadata: Optional[dict] = None
 
 
-class BillingPreviewResponse(BaseModel):
+class BillingPreviewResponse(_DeferredModel):
     """Response for billing preview."""
     client_id: int
     client_name: str
@@ -655,26 +817,28 @@ class BillingPreviewResponse(BaseModel):
     period_start: date
     period_end: date
     currency: str
-    group_by: str
+    group_by: BillingGroupBy
     line_items: list[BillingPreviewLineItem]
     subtotal_amount: float
     billable_hours: float
     non_billable_hours: float
 
 
-class InvoiceCreate(BaseModel):
+class InvoiceCreate(_DeferredModel):
     """Request to create an invoice from preview."""
     client_id: int
     billing_project_id: Optional[int] = None
     period_start: date
     period_end: date
-    group_by: str = "project"
+    group_by: BillingGroupBy = "project"
     taxes_amount: float = 0
     notes: Optional[str] = None
 
 
-class InvoiceLineItemInDB(BaseModel):
+class InvoiceLineItemInDB(_DeferredModel):
     """Invoice line item with database fields."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     id: int
     invoice_id: int
     line_type: str
@@ -686,7 +850,7 @@ class InvoiceLineItemInDB(BaseModel):
     sort_order: int = 0
 
 
-class InvoiceInDB(BaseModel):
+class InvoiceInDB(_DeferredModel):
     """Invoice with database fields."""
     id: int
     client_id: int
@@ -695,12 +859,12 @@ class InvoiceInDB(BaseModel):
     billing_project_name: Optional[str] = None
     period_start: str
     period_end: str
-    status: str = "DRAFT"
+    status: InvoiceStatus = "DRAFT"
     currency: str = "EUR"
     subtotal_amount: float = 0
     taxes_amount: float = 0
     total_amount: float = 0
-    group_by: str = "project"
+    group_by: BillingGroupBy = "project"
     notes: Optional[str] = None
     created_by: Optional[str] = None
     created_at: Optional[str] = None
@@ -708,7 +872,7 @@ class InvoiceInDB(BaseModel):
     line_items: list[InvoiceLineItemInDB] = Field(default_factory=list)
 
 
-class InvoiceListResponse(BaseModel):
+class InvoiceListResponse(_DeferredModel):
     """Response for invoice list."""
     invoices: list[InvoiceInDB]
     total_count: int
@@ -716,18 +880,18 @@ class InvoiceListResponse(BaseModel):
 
 # ============ Factorial HR Models ============
 
-class FactorialConfigCreate(BaseModel):
+class FactorialConfigCreate(_DeferredModel):
     """Request to create/update Factorial configuration."""
     api_key: str
 
 
-class UserFactorialAccount(BaseModel):
+class UserFactorialAccount(_DeferredModel):
     """Factorial employee account mapping for a user."""
     factorial_employee_id: int
     factorial_email: Optional[str] = None
 
 
-class FactorialLeave(BaseModel):
+class FactorialLeave(_DeferredModel):
     """A leave/absence entry from Factorial."""
     id: int
     factorial_leave_id: int
@@ -753,13 +917,13 @@ class FactorialLeave(BaseModel):
         return float(delta)
 
 
-class FetchFactorialIdResponse(BaseModel):
+class FetchFactorialIdResponse(_DeferredModel):
     """Response from fetch Factorial employee ID."""
     factorial_employee_id: int
     factorial_email: str
 
 
-class BulkFetchFactorialResult(BaseModel):
+class BulkFetchFactorialResult(_DeferredModel):
     """Result for a single user in bulk Factorial employee fetch."""
     user_email: str
     user_name: str
@@ -768,7 +932,7 @@ class BulkFetchFactorialResult(BaseModel):
     error: Optional[str] = None
 
 
-class BulkFetchFactorialResponse(BaseModel):
+class BulkFetchFactorialResponse(_DeferredModel):
     """Response from bulk Factorial employee fetch."""
     results: list[BulkFetchFactorialResult]
     summary: dict  # {total, success, failed, skipped}
@@ -796,7 +960,7 @@ class OAuthUserCreate(BaseModel):
     google_id: str
     email: str
     company_id: int
-    role: str = Field(default="DEV", pattern="^(DEV|PM|MANAGER|ADMIN)$")
+    role: RoleName = "DEV"
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     picture_url: Optional[str] = None
@@ -823,7 +987,7 @@ class OAuthUserUpdate(BaseModel):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     picture_url: Optional[str] = None
-    role: Optional[str] = Field(default=None, pattern="^(DEV|PM|MANAGER|ADMIN)$")
+    role: Optional[RoleName] = None
     is_active: Optional[bool] = None
 
 
@@ -845,7 +1009,7 @@ class RefreshTokenRequest(BaseModel):
 class InvitationCreate(BaseModel):
     """Request to create an invitation."""
     email: str
-    role: str = Field(default="DEV", pattern="^(DEV|PM|MANAGER|ADMIN)$")
+    role: RoleName = "DEV"
 
 
 class InvitationResponse(BaseModel):
@@ -898,7 +1062,7 @@ class DevLoginRequest(BaseModel):
     email: str = Field(..., min_length=3, max_length=255)
     first_name: str = Field(default="Dev", min_length=1, max_length=100)
     last_name: str = Field(default="User", min_length=1, max_length=100)
-    role: str = Field(default="ADMIN", pattern="^(DEV|PM|MANAGER|ADMIN)$")
+    role: RoleName = "ADMIN"
 
 
 class AuthAuditLogEntry(BaseModel):
@@ -923,7 +1087,7 @@ class MatchingAlgorithmUpdate(BaseModel):
 class JiraExclusionCreate(BaseModel):
     """Request model for creating JIRA exclusion."""
     exclusion_key: str = Field(..., min_length=1, max_length=50)
-    exclusion_type: str = Field(default="parent_key", pattern="^(issue_key|parent_key)$")
+    exclusion_type: ExclusionType = "parent_key"
     description: Optional[str] = Field(None, max_length=200)
 
 
@@ -1,11 +1,12 @@
 """
 Authentication Router - Google OAuth login, logout, token refresh.
 """
+import asyncio
 from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, Depends, Request, status
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
 from fastapi.responses import RedirectResponse
 from typing import Optional
-import json
 from urllib.parse import urlencode
 
 from ..models import (
@@ -14,17 +15,39 @@ from ..models import (
     UpdateProfileRequest, UpdateCompanyRequest, DevLoginRequest,
     UserRole
 )
-from ..auth.jwt import create_access_token, create_refresh_token, create_onboarding_token, verify_token
+from ..auth.jwt import create_access_token, reuse_or_create_access_token, create_refresh_token, create_onboarding_token, verify_token
 from ..auth.dependencies import get_current_user, get_current_user_optional, require_admin, CurrentUser
 from ..auth.google_oauth import oauth
 from ..auth_config import auth_settings
 from ..cache import get_storage
+from ..config import get_cached_me_response, set_cached_me_response, invalidate_me_responses
 from ..logging_config import get_logger
 
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 logger = get_logger(__name__)
 
+# Once any company exists the first-user onboarding probe can be skipped;
+# None means unknown (re-checked), reset when a company cascade delete may empty the DB
+_companies_exist: Optional[bool] = None
+
+
+async def _any_companies_exist(storage) -> bool:
+    """Return True if at least one active company exists, remembering a positive answer."""
+    global _companies_exist
+    if _companies_exist:
+        return True
+    if await storage.count_companies() > 0:
+        _companies_exist = True
+        return True
+    return False
+
+
+def _reset_companies_exist() -> None:
+    """Forget the cached answer (the last company may have been deleted)."""
+    global _companies_exist
+    _companies_exist = None
+
 
 @router.get("/login")
 async def login(request: Request, platform: str = "web"):
@@ -82,14 +105,17 @@ async def oauth_callback(request: Request):
         if existing_user:
             # Login existing user
             logger.info(f"Existing user login: {email}")
-            await storage.update_oauth_user_last_login(existing_user["id"])
-            await storage.log_auth_event(
-                event_type="login",
-                company_id=existing_user["company_id"],
-                user_id=existing_user["id"],
-                email=email,
-                metadata={"method": "google_oauth"}
+            await asyncio.gather(
+                storage.update_oauth_user_last_login(existing_user["id"]),
+                storage.log_auth_event(
+                    event_type="login",
+                    company_id=existing_user["company_id"],
+                    user_id=existing_user["id"],
+                    email=email,
+                    metadata={"method": "google_oauth"}
+                )
             )
+            invalidate_me_responses(user_id=existing_user["id"])
 
             user_id = existing_user["id"]
             company_id = existing_user["company_id"]
@@ -133,9 +159,7 @@ async def oauth_callback(request: Request):
 
             else:
                 # Check if this is the first user (no companies exist)
-                company_count = await storage.count_companies()
-
-                if company_count == 0:
+                if not await _any_companies_exist(storage):
                     # First user - redirect to onboarding
                     logger.info(f"First user signup: {email} - redirecting to onboarding")
 
@@ -176,13 +200,13 @@ async def oauth_callback(request: Request):
         access_token = create_access_token(user_id, company_id, email, role, role_level=role_level)
         refresh_token_str = create_refresh_token()
 
-        # Save session
+        # Save session while fetching full user and company data (independent)
         expires_at = datetime.utcnow() + timedelta(days=auth_settings.REFRESH_TOKEN_EXPIRE_DAYS)
-        await storage.create_session(user_id, refresh_token_str, expires_at)
-
-        # Get full user and company data
-        user = await storage.get_oauth_user_by_id(user_id)
-        company = await storage.get_company(company_id)
+        _, row = await asyncio.gather(
+            storage.create_session(user_id, refresh_token_str, expires_at),
+            storage.get_user_with_company(user_id)
+        )
+        user, company = row["user"], row["company"]
 
         logger.info(f"Authentication successful for {email}")
 
@@ -191,8 +215,8 @@ async def oauth_callback(request: Request):
         params = urlencode({
             "access_token": access_token,
             "refresh_token": refresh_token_str,
-            "user": json.dumps(OAuthUserResponse(**user).dict()),
-            "company": json.dumps(CompanyResponse(**company).dict())
+            "user": OAuthUserResponse(**user).model_dump_json(),
+            "company": CompanyResponse(**company).model_dump_json()
         })
 
         redirect_url = f"{frontend_url}/login?{params}"
@@ -277,9 +301,9 @@ async def refresh_token(request: RefreshTokenRequest):
             detail="User not found or inactive"
         )
 
-    # Generate new access token
+    # Generate new access token (or hand back one minted moments ago for the same claims)
     role_level = UserRole.get_level(user["role"])
-    access_token = create_access_token(
+    access_token, expires_in = reuse_or_create_access_token(
         user["id"],
         user["company_id"],
         user["email"],
@@ -292,7 +316,7 @@ async def refresh_token(request: RefreshTokenRequest):
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "expires_in": auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        "expires_in": expires_in
     }
 
 
@@ -304,16 +328,20 @@ async def get_me(current_user: CurrentUser = Depends(get_current_user)):
     Returns:
         User and company information
     """
+    cached = get_cached_me_response(current_user.id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     storage = get_storage()
 
-    user = await storage.get_oauth_user_by_id(current_user.id)
-    company = await storage.get_company(current_user.company_id)
+    row = await storage.get_user_with_company(current_user.id)
 
-    if not user:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
+    user, company = row["user"], row["company"]
 
     if not company:
         raise HTTPException(
@@ -321,10 +349,12 @@ async def get_me(current_user: CurrentUser = Depends(get_current_user)):
             detail="Company not found"
         )
 
-    return {
-        "user": OAuthUserResponse(**user),
-        "company": CompanyResponse(**company)
-    }
+    body = orjson.dumps({
+        "user": OAuthUserResponse(**user).model_dump(mode="json"),
+        "company": CompanyResponse(**company).model_dump(mode="json")
+    })
+    set_cached_me_response(current_user.id, company["id"], body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/dev/login")
@@ -365,9 +395,7 @@ async def dev_login(request: DevLoginRequest):
     logger.info(f"Dev login attempt for email: {email}, role: {role}")
 
     # 3. Check if this is first user (no companies exist) - require onboarding
-    company_count = await storage.count_companies()
-
-    if company_count == 0:
+    if not await _any_companies_exist(storage):
         logger.info("No companies found - first dev user requires onboarding")
 
         # Generate onboarding token (like OAuth flow)
@@ -400,6 +428,7 @@ async def dev_login(request: DevLoginRequest):
         logger.info(f"Existing dev user login: {email}, company_id={company_id}")
         user_id = user["id"]
         await storage.update_oauth_user_last_login(user_id)
+        invalidate_me_responses(user_id=user_id)
     else:
         # User doesn't exist - create NEW company for this dev user
         domain = email.split('@')[1] if '@' in email else 'dev.local'
@@ -432,21 +461,19 @@ async def dev_login(request: DevLoginRequest):
         days=auth_settings.REFRESH_TOKEN_EXPIRE_DAYS
     )
 
-    # 6. Create session
-    await storage.create_session(user_id, refresh_token_str, expires_at)
-
-    # 7. Log auth event
-    await storage.log_auth_event(
-        event_type="dev_login",
-        company_id=company_id,
-        user_id=user_id,
-        email=email,
-        metadata={"role": role, "method": "dev_bypass"}
+    # 6-8. Create session, log auth event and fetch full user and company data (independent)
+    _, _, row = await asyncio.gather(
+        storage.create_session(user_id, refresh_token_str, expires_at),
+        storage.log_auth_event(
+            event_type="dev_login",
+            company_id=company_id,
+            user_id=user_id,
+            email=email,
+            metadata={"role": role, "method": "dev_bypass"}
+        ),
+        storage.get_user_with_company(user_id)
     )
-
-    # 8. Fetch full user and company data
-    user = await storage.get_oauth_user_by_id(user_id)
-    company = await storage.get_company(company_id)
+    user, company = row["user"], row["company"]
 
     logger.info(f"Dev login successful for {email}")
 
@@ -530,8 +557,8 @@ async def complete_onboarding(request: CompleteOnboardingRequest):
     await storage.create_session(user_id, refresh_token_str, expires_at)
 
     # 7. Return full token response
-    user = await storage.get_oauth_user_by_id(user_id)
-    company = await storage.get_company(company_id)
+    row = await storage.get_user_with_company(user_id)
+    user, company = row["user"], row["company"]
 
     logger.info(f"Onboarding complete for {email}, company: {request.company_name}")
 
@@ -560,10 +587,11 @@ async def update_profile(
         first_name=request.first_name,
         last_name=request.last_name
     )
+    invalidate_me_responses(user_id=current_user.id)
 
     # Return updated user
-    user = await storage.get_oauth_user_by_id(current_user.id)
-    company = await storage.get_company(current_user.company_id)
+    row = await storage.get_user_with_company(current_user.id)
+    user, company = row["user"], row["company"]
 
     logger.info(f"Profile updated for {current_user.email}")
 
@@ -593,6 +621,7 @@ async def update_company(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Company not found"
         )
+    invalidate_me_responses(company_id=current_user.company_id)
 
     company = await storage.get_company(current_user.company_id)
 
@@ -642,6 +671,7 @@ async def delete_account(current_user: CurrentUser = Depends(get_current_user)):
 
     # Delete the user
     deleted = await storage.delete_oauth_user(user_id)
+    invalidate_me_responses(user_id=user_id)
 
     if not deleted:
         raise HTTPException(
@@ -655,6 +685,8 @@ async def delete_account(current_user: CurrentUser = Depends(get_current_user)):
     if user_count == 1:
         logger.warning(f"Last user deleted, cascading company deletion for company_id={company_id}")
         company_deleted = await storage.delete_company_cascade(company_id)
+        _reset_companies_exist()
+        invalidate_me_responses(company_id=company_id)
 
         if company_deleted:
             logger.warning(f"Company {company_id} and all associated data deleted (cascade)")
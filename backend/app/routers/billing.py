@@ -12,7 +12,7 @@ from ..models import (
     BillingProjectMappingCreate,
     BillingRateCreate,
     BillingClassificationCreate, BillingClassificationBulk,
-    BillingPreviewResponse,
+    BillingPreviewResponse, BillingGroupBy,
     InvoiceCreate, InvoiceListResponse,
 )
 from ..cache import get_storage
@@ -276,7 +276,7 @@ async def billing_preview(
     client_id: int = Query(...),
     period_start: date = Query(...),
     period_end: date = Query(...),
-    group_by: str = Query("project"),
+    group_by: BillingGroupBy = Query("project"),
     billing_project_id: int = Query(None),
     current_user: CurrentUser = Depends(get_current_user)
 ):
@@ -3,24 +3,53 @@ Dashboard API router - global statistics and overview.
 """
 from datetime import date, timedelta
 from collections import defaultdict
+from heapq import nlargest
+from dataclasses import dataclass, field
+from typing import Optional
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response, StreamingResponse
 
 from ..models import (
-    DashboardResponse, TeamHours, DailyHours, EpicHours,
+    DashboardResponse, TeamHours, DailyHours, DailyTrendColumns, InstanceTrendMatrix, EpicHours,
     AppConfig, Worklog,
     MultiJiraOverviewResponse, InstanceOverview,
     ComplementaryComparison, DiscrepancyItem
 )
 from ..config import (
     get_config, get_users_from_db, get_complementary_instances_from_db,
-    get_jira_instances_from_db
+    get_jira_instances_from_db, get_cached_dashboard_response, set_cached_dashboard_response
 )
 from ..cache import get_storage
 from ..auth.dependencies import get_current_user, CurrentUser
-from ..matching_algorithms import get_algorithm, apply_generic_issues
+from ..matching_algorithms import get_algorithm, apply_generic_issues, to_match_worklogs
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
+def model_response(model, cache_key: Optional[tuple] = None) -> Response:
+    """
+    Serialize a response model straight to JSON bytes in pydantic-core.
+
+    Skips FastAPI's response_model re-validation and jsonable_encoder pass; the
+    route keeps response_model= for the OpenAPI schema. With cache_key, the
+    bytes are also stored in the dashboard response cache.
+    """
+    body = model.model_dump_json().encode()
+    if cache_key is not None:
+        set_cached_dashboard_response(cache_key, body)
+    return Response(body, media_type="application/json")
+
+
+def cached_response(cache_key: tuple) -> Optional[Response]:
+    """Return the cached serialized response for cache_key, if still fresh."""
+    body = get_cached_dashboard_response(cache_key)
+    return Response(body, media_type="application/json") if body is not None else None
+
+
+# Bound once: these are built per day / per initiative / per discrepancy row
+_make_daily_hours = DailyHours.model_construct
+_make_epic_hours = EpicHours.model_construct
+_make_discrepancy = DiscrepancyItem.model_construct
+
 
 @router.get("", response_model=DashboardResponse)
 async def get_dashboard(
@@ -31,6 +60,14 @@ async def get_dashboard(
     config: AppConfig = Depends(get_config)
 ):
     """Get global dashboard statistics from local storage (scoped to company)."""
+    cache_key = (
+        current_user.company_id, "dashboard", start_date, end_date, jira_instance,
+        config.settings.daily_working_hours
+    )
+    cached = cached_response(cache_key)
+    if cached is not None:
+        return cached
+
     storage = get_storage()
 
     # Get all users from database (scoped to company)
@@ -96,10 +133,10 @@ async def get_dashboard(
     )
 
     # Top epics
-    top_epics = calculate_epic_hours(worklogs)[:10]
+    top_epics = calculate_epic_hours(worklogs, limit=10)
 
     # Top projects (for "By Project" chart)
-    top_projects = calculate_project_hours(worklogs)[:10]
+    top_projects = calculate_project_hours(worklogs, limit=10)
 
     # Completion percentage
     completion = (total_hours / expected_hours * 100) if expected_hours > 0 else 0
@@ -107,7 +144,7 @@ async def get_dashboard(
     # Calculate active users (unique authors with worklogs in period)
     active_users = len(set(w.author_email.lower() for w in worklogs))
 
-    return DashboardResponse(
+    return model_response(DashboardResponse(
         total_hours=round(total_hours, 2),
         expected_hours=round(expected_hours, 2),
         completion_percentage=round(completion, 1),
@@ -119,7 +156,7 @@ async def get_dashboard(
         period_end=end_date,
         worklog_count=len(worklogs),
         active_users=active_users
-    )
+    ), cache_key)
 
 
 
@@ -144,6 +181,19 @@ def calculate_expected_hours(
     return working_days * num_users * daily_hours
 
 
+def instance_table(worklogs) -> tuple[list[str], dict[str, int]]:
+    """Number the (few) JIRA instances present in worklogs, in first-seen order."""
+    instance_names = list(dict.fromkeys(wl.jira_instance for wl in worklogs))
+    return instance_names, {name: idx for idx, name in enumerate(instance_names)}
+
+
+def instance_row_to_dict(instance_names: list[str], row: list | None) -> dict[str, float]:
+    """Turn a per-instance seconds row (None = no worklogs) into the rounded name -> hours dict."""
+    if not row:
+        return {}
+    return {name: round(seconds / 3600, 2) for name, seconds in zip(instance_names, row) if seconds is not None}
+
+
 def calculate_team_hours(
     worklogs: list[Worklog],
     email_to_team: dict[str, str],
@@ -163,22 +213,28 @@ def calculate_team_hours(
             team_member_count[team_name] += 1
 
     # Then calculate hours from worklogs (filtered for totals)
-    team_hours = defaultdict(float)
+    team_seconds = defaultdict(int)
     teams_with_worklogs = set()
 
     for wl in worklogs:
         team_name = email_to_team.get(wl.author_email.lower())
         if team_name:
-            team_hours[team_name] += wl.time_spent_seconds / 3600
+            team_seconds[team_name] += wl.time_spent_seconds
             teams_with_worklogs.add(team_name)
 
     # Calculate hours per instance (from ALL worklogs, including secondary instances)
-    team_instance_hours: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
     source_worklogs = all_worklogs if all_worklogs else worklogs
+    instance_names, instance_index = instance_table(source_worklogs)
+    team_instance_seconds: dict[str, list] = {}
     for wl in source_worklogs:
         team_name = email_to_team.get(wl.author_email.lower())
         if team_name and wl.jira_instance:
-            team_instance_hours[team_name][wl.jira_instance] += wl.time_spent_seconds / 3600
+            row = team_instance_seconds.get(team_name)
+            if row is None:
+                row = team_instance_seconds[team_name] = [None] * len(instance_names)
+            idx = instance_index[wl.jira_instance]
+            seconds = wl.time_spent_seconds
+            row[idx] = seconds if row[idx] is None else row[idx] + seconds
 
     # Calculate expected hours per team (based on member count)
     working_days = 0
@@ -196,12 +252,12 @@ def calculate_team_hours(
     for team_name in sorted(all_teams):
         member_count = team_member_count.get(team_name, 0)
         expected = working_days * member_count * daily_working_hours
-        instance_hours = {k: round(v, 2) for k, v in team_instance_hours.get(team_name, {}).items()}
+        instance_hours = instance_row_to_dict(instance_names, team_instance_seconds.get(team_name))
 
-        result.append(TeamHours(
+        result.append(TeamHours.model_construct(
             team_name=team_name,
             name=team_name,  # Alias for frontend compatibility
-            total_hours=round(team_hours.get(team_name, 0), 2),
+            total_hours=round(team_seconds.get(team_name, 0) / 3600, 2),
             expected_hours=round(expected, 2),
             member_count=member_count,
             hours_by_instance=instance_hours
@@ -210,29 +266,68 @@ def calculate_team_hours(
     return result
 
 
+def _bucket_seconds_by_day(worklogs, start_ordinal: int, num_days: int) -> list[int]:
+    """Sum seconds into a list indexed by day offset from start (out-of-range days are dropped)."""
+    seconds = [0] * num_days
+    for wl in worklogs:
+        offset = wl.started.toordinal() - start_ordinal
+        if 0 <= offset < num_days:
+            seconds[offset] += wl.time_spent_seconds
+    return seconds
+
+
+def _daily_hours_from_buckets(seconds: list[int], start_ordinal: int) -> list[DailyHours]:
+    """Build one DailyHours per bucket, including zero days."""
+    return [
+        _make_daily_hours(
+            date=date.fromordinal(start_ordinal + offset),
+            hours=round(day_seconds / 3600, 2)
+        )
+        for offset, day_seconds in enumerate(seconds)
+    ]
+
+
 def calculate_daily_trend(
     worklogs: list[Worklog], 
     start_date: date, 
     end_date: date
 ) -> list[DailyHours]:
     """Calculate hours per day."""
-    daily = defaultdict(float)
-    
+    start_ordinal = start_date.toordinal()
+    num_days = max((end_date - start_date).days + 1, 0)
+    seconds = _bucket_seconds_by_day(worklogs, start_ordinal, num_days)
+    return _daily_hours_from_buckets(seconds, start_ordinal)
+
+
+def calculate_daily_trend_columns(
+    worklogs: list[Worklog],
+    start_date: date,
+    end_date: date
+) -> DailyTrendColumns:
+    """Calculate hours per day as parallel date/hours lists (no per-day objects)."""
+    start_ordinal = start_date.toordinal()
+    num_days = max((end_date - start_date).days + 1, 0)
+    seconds = _bucket_seconds_by_day(worklogs, start_ordinal, num_days)
+    return DailyTrendColumns.model_construct(
+        dates=[date.fromordinal(start_ordinal + offset) for offset in range(num_days)],
+        hours=[round(day_seconds / 3600, 2) for day_seconds in seconds]
+    )
+
+
+def _bucket_seconds_by_instance_day(
+    worklogs, start_ordinal: int, num_days: int
+) -> dict[str, list[int]]:
+    """Sum seconds into one day-offset row per instance in a single pass (first-seen instance order)."""
+    rows: dict[str, list[int]] = {}
     for wl in worklogs:
-        day = wl.started.date()
-        daily[day] += wl.time_spent_seconds / 3600
-    
-    # Fill in missing days with 0
-    result = []
-    current = start_date
-    while current <= end_date:
-        result.append(DailyHours(
-            date=current,
-            hours=round(daily.get(current, 0), 2)
-        ))
-        current += timedelta(days=1)
-    
-    return result
+        instance = wl.jira_instance or "Unknown"
+        row = rows.get(instance)
+        if row is None:
+            row = rows[instance] = [0] * num_days
+        offset = wl.started.toordinal() - start_ordinal
+        if 0 <= offset < num_days:
+            row[offset] += wl.time_spent_seconds
+    return rows
 
 
 def calculate_daily_trend_by_instance(
@@ -241,58 +336,74 @@ def calculate_daily_trend_by_instance(
     end_date: date
 ) -> dict[str, list[DailyHours]]:
     """Calculate hours per day grouped by JIRA instance."""
-    # Group by instance then by day
-    instance_daily: dict[str, dict] = defaultdict(lambda: defaultdict(float))
+    start_ordinal = start_date.toordinal()
+    num_days = max((end_date - start_date).days + 1, 0)
+    rows = _bucket_seconds_by_instance_day(worklogs, start_ordinal, num_days)
+    return {
+        instance: _daily_hours_from_buckets(seconds, start_ordinal)
+        for instance, seconds in rows.items()
+    }
 
-    for wl in worklogs:
-        instance = wl.jira_instance or "Unknown"
-        day = wl.started.date()
-        instance_daily[instance][day] += wl.time_spent_seconds / 3600
 
-    # Build result with all days filled in
-    result = {}
-    for instance, daily in instance_daily.items():
-        days = []
-        current = start_date
-        while current <= end_date:
-            days.append(DailyHours(
-                date=current,
-                hours=round(daily.get(current, 0), 2)
-            ))
-            current += timedelta(days=1)
-        result[instance] = days
+def calculate_daily_trend_by_instance_matrix(
+    worklogs: list[Worklog],
+    start_date: date,
+    end_date: date
+) -> InstanceTrendMatrix:
+    """Calculate hours per day per JIRA instance as one row of hours per instance (no per-day objects)."""
+    start_ordinal = start_date.toordinal()
+    num_days = max((end_date - start_date).days + 1, 0)
+    rows = _bucket_seconds_by_instance_day(worklogs, start_ordinal, num_days)
+    return InstanceTrendMatrix.model_construct(
+        instance_names=list(rows),
+        dates=[date.fromordinal(start_ordinal + offset) for offset in range(num_days)],
+        hours=[[round(day_seconds / 3600, 2) for day_seconds in seconds] for seconds in rows.values()]
+    )
+
+
+@dataclass(slots=True)
+class _InitiativeTotals:
+    """Per-key accumulator for epic/project hours; turned into EpicHours at the end."""
+    name: str = "Unknown"
+    type: Optional[str] = None
+    seconds: int = 0
+    contributors: set = field(default_factory=set)
+    instance: str = ""
 
-    return result
 
+def _rounded_hours(item: tuple[str, _InitiativeTotals]) -> float:
+    """Sort key for (key, totals) pairs: the hours value the response will show."""
+    return round(item[1].seconds / 3600, 2)
 
-def calculate_epic_hours(worklogs: list[Worklog]) -> list[EpicHours]:
-    """Calculate hours per parent initiative (Epic, Project, etc.)."""
-    initiative_data = defaultdict(lambda: {
-        "name": "Unknown",
-        "type": None,
-        "hours": 0,
-        "contributors": set(),
-        "instance": ""
-    })
+
+def calculate_epic_hours(worklogs: list[Worklog], limit: Optional[int] = None) -> list[EpicHours]:
+    """Calculate hours per parent initiative (Epic, Project, etc.), optionally only the top `limit`."""
+    initiative_data: dict[str, _InitiativeTotals] = defaultdict(_InitiativeTotals)
 
     for wl in worklogs:
         # Use parent_key/parent_name/parent_type instead of epic_key/epic_name
         if wl.parent_key:
-            initiative_data[wl.parent_key]["name"] = wl.parent_name or "Unknown"
-            initiative_data[wl.parent_key]["type"] = wl.parent_type
-            initiative_data[wl.parent_key]["hours"] += wl.time_spent_seconds / 3600
-            initiative_data[wl.parent_key]["contributors"].add(wl.author_email)
-            initiative_data[wl.parent_key]["instance"] = wl.jira_instance
+            data = initiative_data[wl.parent_key]
+            data.name = wl.parent_name or "Unknown"
+            data.type = wl.parent_type
+            data.seconds += wl.time_spent_seconds
+            data.contributors.add(wl.author_email)
+            data.instance = wl.jira_instance
+
+    items = initiative_data.items()
+    if limit is not None:
+        # Same order and ties as sorting everything and slicing, without building every item
+        items = nlargest(limit, items, key=_rounded_hours)
 
     result = []
-    for parent_key, data in initiative_data.items():
-        result.append(EpicHours(
+    for parent_key, data in items:
+        result.append(_make_epic_hours(
             epic_key=parent_key,  # Using epic_key field for backward compatibility
-            epic_name=data["name"],  # Using epic_name field for backward compatibility
-            total_hours=round(data["hours"], 2),
-            contributor_count=len(data["contributors"]),
-            jira_instance=data["instance"],
-            parent_type=data["type"]
+            epic_name=data.name,  # Using epic_name field for backward compatibility
+            total_hours=round(data.seconds / 3600, 2),
+            contributor_count=len(data.contributors),
+            jira_instance=data.instance,
+            parent_type=data.type
         ))
 
     # Sort by hours descending
@@ -300,29 +411,30 @@ def calculate_epic_hours(worklogs: list[Worklog]) -> list[EpicHours]:
     return result
 
 
-def calculate_project_hours(worklogs: list[Worklog]) -> list[EpicHours]:
-    """Calculate hours per JIRA project (extracted from issue_key)."""
-    project_data = defaultdict(lambda: {
-        "hours": 0,
-        "contributors": set(),
-        "instance": ""
-    })
+def calculate_project_hours(worklogs: list[Worklog], limit: Optional[int] = None) -> list[EpicHours]:
+    """Calculate hours per JIRA project (extracted from issue_key), optionally only the top `limit`."""
+    project_data: dict[str, _InitiativeTotals] = defaultdict(_InitiativeTotals)
 
     for wl in worklogs:
         # Extract project key from issue_key (e.g., "DLREQ-1464" -> "DLREQ")
         project_key = wl.issue_key.split('-')[0] if '-' in wl.issue_key else wl.issue_key
-        project_data[project_key]["hours"] += wl.time_spent_seconds / 3600
-        project_data[project_key]["contributors"].add(wl.author_email)
-        project_data[project_key]["instance"] = wl.jira_instance
+        data = project_data[project_key]
+        data.seconds += wl.time_spent_seconds
+        data.contributors.add(wl.author_email)
+        data.instance = wl.jira_instance
+
+    items = project_data.items()
+    if limit is not None:
+        items = nlargest(limit, items, key=_rounded_hours)
 
     result = []
-    for project_key, data in project_data.items():
-        result.append(EpicHours(
+    for project_key, data in items:
+        result.append(_make_epic_hours(
             epic_key=project_key,
             epic_name=project_key,  # Use project key as name (clean, readable)
-            total_hours=round(data["hours"], 2),
-            contributor_count=len(data["contributors"]),
-            jira_instance=data["instance"],
+            total_hours=round(data.seconds / 3600, 2),
+            contributor_count=len(data.contributors),
+            jira_instance=data.instance,
             parent_type="Project"
         ))
 
@@ -337,16 +449,16 @@ def calculate_discrepancies_legacy(primary_wls: list[Worklog], secondary_wls: li
     Used when no matching algorithms are enabled.
     """
     # Build per-initiative hours for both
-    primary_by_init = defaultdict(lambda: {"hours": 0, "name": ""})
+    primary_by_init = defaultdict(lambda: {"seconds": 0, "name": ""})
     for w in primary_wls:
         if w.parent_key:
-            primary_by_init[w.parent_key]["hours"] += w.time_spent_seconds / 3600
+            primary_by_init[w.parent_key]["seconds"] += w.time_spent_seconds
             primary_by_init[w.parent_key]["name"] = w.parent_name or w.parent_key
 
-    secondary_by_init = defaultdict(lambda: {"hours": 0, "name": ""})
+    secondary_by_init = defaultdict(lambda: {"seconds": 0, "name": ""})
     for w in secondary_wls:
         if w.parent_key:
-            secondary_by_init[w.parent_key]["hours"] += w.time_spent_seconds / 3600
+            secondary_by_init[w.parent_key]["seconds"] += w.time_spent_seconds
             secondary_by_init[w.parent_key]["name"] = w.parent_name or w.parent_key
 
     # Find discrepancies
@@ -354,8 +466,8 @@ def calculate_discrepancies_legacy(primary_wls: list[Worklog], secondary_wls: li
     discrepancies = []
 
     for key in all_keys:
-        p_hours = primary_by_init[key]["hours"] if key in primary_by_init else 0
-        s_hours = secondary_by_init[key]["hours"] if key in secondary_by_init else 0
+        p_hours = primary_by_init[key]["seconds"] / 3600 if key in primary_by_init else 0
+        s_hours = secondary_by_init[key]["seconds"] / 3600 if key in secondary_by_init else 0
         delta = abs(p_hours - s_hours)
         max_hours = max(p_hours, s_hours)
         delta_pct = (delta / max_hours * 100) if max_hours > 0 else 0
@@ -364,7 +476,7 @@ def calculate_discrepancies_legacy(primary_wls: list[Worklog], secondary_wls: li
         if delta > 1 or delta_pct > 10:
             name = (primary_by_init.get(key, {}).get("name") or
                     secondary_by_init.get(key, {}).get("name") or key)
-            discrepancies.append(DiscrepancyItem(
+            discrepancies.append(_make_discrepancy(
                 initiative_key=key,
                 initiative_name=name,
                 primary_hours=round(p_hours, 2),
@@ -376,39 +488,43 @@ def calculate_discrepancies_legacy(primary_wls: list[Worklog], secondary_wls: li
     return discrepancies
 
 
-@router.get("/multi-jira-overview", response_model=MultiJiraOverviewResponse)
-async def get_multi_jira_overview(
-    start_date: date = Query(..., description="Start date for the period"),
-    end_date: date = Query(..., description="End date for the period"),
-    current_user: CurrentUser = Depends(get_current_user),
-    config: AppConfig = Depends(get_config)
-):
-    """Get overview data for all JIRA instances with complementary comparisons (scoped to company)."""
+async def _multi_jira_context(start_date: date, end_date: date, company_id: int, daily_working_hours: int):
+    """Load what every multi-JIRA overview section needs: users, emails, instances, expected hours."""
     storage = get_storage()
 
-    users = await get_users_from_db(current_user.company_id)
+    users = await get_users_from_db(company_id)
     all_emails = [u["email"] for u in users]
-    jira_instances = await get_jira_instances_from_db(current_user.company_id)
+    jira_instances = await get_jira_instances_from_db(company_id)
 
     # Calculate expected hours (shared across all instances, excluding holidays, scoped to company)
     holiday_dates = await storage.get_active_holiday_dates(
-        start_date.isoformat(), end_date.isoformat(), current_user.company_id
+        start_date.isoformat(), end_date.isoformat(), company_id
     )
     expected_hours = calculate_expected_hours(
-        start_date, end_date, len(all_emails), config.settings.daily_working_hours,
+        start_date, end_date, len(all_emails), daily_working_hours,
         holiday_dates
     )
+    return users, all_emails, jira_instances, expected_hours
 
-    # Gather per-instance data
-    instances_overview = []
-    instance_worklogs = {}  # Store worklogs per instance for complementary comparison
+
+async def _iter_instance_overviews(
+    jira_instances,
+    all_emails: list[str],
+    start_date: date,
+    end_date: date,
+    expected_hours: float,
+    company_id: int,
+    instance_worklogs: dict[str, list[Worklog]]
+):
+    """Yield one InstanceOverview per instance, storing fetched worklogs in instance_worklogs."""
+    storage = get_storage()
 
     for inst in jira_instances:
         worklogs = await storage.get_worklogs_in_range(
             start_date, end_date,
             user_emails=all_emails,
             jira_instance=inst.name,
-            company_id=current_user.company_id
+            company_id=company_id
         )
         instance_worklogs[inst.name] = worklogs
 
@@ -426,7 +542,7 @@ async def get_multi_jira_overview(
 
         daily_trend = calculate_daily_trend(worklogs, start_date, end_date)
 
-        instances_overview.append(InstanceOverview(
+        yield InstanceOverview.model_construct(
             instance_name=inst.name,
             total_hours=round(total_hours, 2),
             expected_hours=round(expected_hours, 2),
@@ -434,20 +550,57 @@ async def get_multi_jira_overview(
             initiative_count=len(initiatives),
             contributor_count=len(contributors),
             daily_trend=daily_trend
-        ))
+        )
+
+
+async def _iter_complementary_comparisons(
+    jira_instances,
+    users: list[dict],
+    all_emails: list[str],
+    start_date: date,
+    end_date: date,
+    company_id: int,
+    instance_worklogs: dict[str, list[Worklog]]
+):
+    """
+    Yield one ComplementaryComparison per (primary, secondary) pair.
 
-    # Build complementary comparisons
-    complementary_comparisons = []
-    complementary_groups = await get_complementary_instances_from_db(current_user.company_id)
+    Worklogs already in instance_worklogs are reused; the rest are fetched on
+    first use, and only for instances that actually take part in a group.
+    """
+    storage = get_storage()
+    known_instances = {inst.name for inst in jira_instances}
+
+    async def worklogs_for(instance_name: str) -> list[Worklog]:
+        if instance_name not in instance_worklogs:
+            if instance_name not in known_instances:
+                return []
+            instance_worklogs[instance_name] = await storage.get_worklogs_in_range(
+                start_date, end_date,
+                user_emails=all_emails,
+                jira_instance=instance_name,
+                company_id=company_id
+            )
+        return instance_worklogs[instance_name]
+
+    complementary_groups = await get_complementary_instances_from_db(company_id)
 
     # Check if matching algorithms are enabled
-    matching_algorithms = await storage.get_matching_algorithms(current_user.company_id)
+    matching_algorithms = await storage.get_matching_algorithms(company_id)
     enabled_algorithms = [algo for algo in matching_algorithms if algo['enabled']]
 
     # Get JIRA exclusions (expected discrepancies like leaves, training)
-    jira_exclusions = await storage.get_jira_exclusions(current_user.company_id)
+    jira_exclusions = await storage.get_jira_exclusions(company_id)
     exclusion_keys = [exc['exclusion_key'] for exc in jira_exclusions if exc['exclusion_type'] == 'parent_key']
 
+    # Slim copies for the matching hot loops, converted once per instance
+    match_worklogs = {}
+
+    def match_worklogs_for(instance_name: str, worklogs: list[Worklog]):
+        if instance_name not in match_worklogs:
+            match_worklogs[instance_name] = to_match_worklogs(worklogs)
+        return match_worklogs[instance_name]
+
     for group_name, group_instances in complementary_groups.items():
         if len(group_instances) < 2:
             continue
@@ -455,8 +608,8 @@ async def get_multi_jira_overview(
         primary_name = group_instances[0]
         # Compare primary with each secondary
         for secondary_name in group_instances[1:]:
-            primary_wls = instance_worklogs.get(primary_name, [])
-            secondary_wls = instance_worklogs.get(secondary_name, [])
+            primary_wls = await worklogs_for(primary_name)
+            secondary_wls = await worklogs_for(secondary_name)
 
             primary_total = sum(w.time_spent_seconds for w in primary_wls) / 3600
             secondary_total = sum(w.time_spent_seconds for w in secondary_wls) / 3600
@@ -474,32 +627,40 @@ async def get_multi_jira_overview(
 
                 if algorithm:
                     # Get generic issues BEFORE matching to exclude them from parent linking
-                    generic_issues = await storage.get_generic_issues(current_user.company_id)
+                    generic_issues = await storage.get_generic_issues(company_id)
                     generic_issue_codes = [gi['issue_code'] for gi in generic_issues] if generic_issues else []
 
                     # Get matched groups from algorithm
                     import json
                     config = json.loads(algo_config['config']) if isinstance(algo_config['config'], str) else algo_config['config']
-                    matched_groups = algorithm.find_groups(
-                        primary_wls, secondary_wls, config, exclusion_keys, generic_issue_codes
-                    )
-
+                    primary_match_wls = match_worklogs_for(primary_name, primary_wls)
+                    secondary_match_wls = match_worklogs_for(secondary_name, secondary_wls)
                     # Apply generic issues matching (container issues by issue_type)
                     if generic_issues:
+                        matched_groups = algorithm.find_groups(
+                            primary_match_wls, secondary_match_wls, config, exclusion_keys, generic_issue_codes
+                        )
                         user_to_team = {u["email"].lower(): u.get("team_id") for u in users}
                         matched_groups = apply_generic_issues(
-                            matched_groups, generic_issues, primary_wls, secondary_wls, user_to_team
+                            matched_groups, generic_issues, primary_match_wls, secondary_match_wls, user_to_team
+                        )
+                        groups = matched_groups.values()
+                    else:
+                        # Nothing else needs the full dict: stream groups and keep only discrepancies
+                        groups = algorithm.iter_groups(
+                            primary_match_wls, secondary_match_wls, config, exclusion_keys, generic_issue_codes
                         )
 
                     # For each matched group, check if hours align
-                    for linking_key, group in matched_groups.items():
+                    for group in groups:
+                        linking_key = group.linking_key
                         delta = abs(group.delta)
                         max_hours = max(group.primary_hours, group.secondary_hours)
                         delta_pct = (delta / max_hours * 100) if max_hours > 0 else 0
 
                         # Report all discrepancies (>1h or >10%), including excluded ones
                         if delta > 1 or delta_pct > 10:
-                            discrepancies.append(DiscrepancyItem(
+                            discrepancies.append(_make_discrepancy(
                                 initiative_key=linking_key,
                                 initiative_name=linking_key,
                                 primary_hours=round(group.primary_hours, 2),
@@ -518,18 +679,103 @@ async def get_multi_jira_overview(
             # Sort by delta descending
             discrepancies.sort(key=lambda d: d.delta_hours, reverse=True)
 
-            complementary_comparisons.append(ComplementaryComparison(
+            yield ComplementaryComparison(
                 group_name=group_name,
                 primary_instance=primary_name,
                 secondary_instance=secondary_name,
                 primary_total_hours=round(primary_total, 2),
                 secondary_total_hours=round(secondary_total, 2),
                 discrepancies=discrepancies
-            ))
+            )
+
+
+def _ndjson_stream(items):
+    """Wrap an async iterator of models as a newline-delimited JSON streaming response."""
+    async def generate():
+        async for item in items:
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+@router.get("/multi-jira-overview", response_model=MultiJiraOverviewResponse)
+async def get_multi_jira_overview(
+    start_date: date = Query(..., description="Start date for the period"),
+    end_date: date = Query(..., description="End date for the period"),
+    current_user: CurrentUser = Depends(get_current_user),
+    config: AppConfig = Depends(get_config)
+):
+    """Get overview data for all JIRA instances with complementary comparisons (scoped to company)."""
+    company_id = current_user.company_id
+    cache_key = (
+        company_id, "multi-jira-overview", start_date, end_date,
+        config.settings.daily_working_hours
+    )
+    cached = cached_response(cache_key)
+    if cached is not None:
+        return cached
+
+    users, all_emails, jira_instances, expected_hours = await _multi_jira_context(
+        start_date, end_date, company_id, config.settings.daily_working_hours
+    )
 
-    return MultiJiraOverviewResponse(
+    # Worklogs fetched for the instance section are reused by the comparisons
+    instance_worklogs: dict[str, list[Worklog]] = {}
+    instances_overview = [
+        overview async for overview in _iter_instance_overviews(
+            jira_instances, all_emails, start_date, end_date, expected_hours, company_id, instance_worklogs
+        )
+    ]
+    complementary_comparisons = [
+        comparison async for comparison in _iter_complementary_comparisons(
+            jira_instances, users, all_emails, start_date, end_date, company_id, instance_worklogs
+        )
+    ]
+
+    return model_response(MultiJiraOverviewResponse(
         instances=instances_overview,
         complementary_comparisons=complementary_comparisons,
         period_start=start_date,
         period_end=end_date
+    ), cache_key)
+
+
+@router.get("/multi-jira-overview/instances")
+async def stream_multi_jira_instances(
+    start_date: date = Query(..., description="Start date for the period"),
+    end_date: date = Query(..., description="End date for the period"),
+    current_user: CurrentUser = Depends(get_current_user),
+    config: AppConfig = Depends(get_config)
+):
+    """Stream the instances section of the multi-JIRA overview as NDJSON, one InstanceOverview per line."""
+    company_id = current_user.company_id
+    _, all_emails, jira_instances, expected_hours = await _multi_jira_context(
+        start_date, end_date, company_id, config.settings.daily_working_hours
+    )
+    return _ndjson_stream(_iter_instance_overviews(
+        jira_instances, all_emails, start_date, end_date, expected_hours, company_id, {}
+    ))
+
+
+@router.get("/multi-jira-overview/comparisons")
+async def stream_multi_jira_comparisons(
+    start_date: date = Query(..., description="Start date for the period"),
+    end_date: date = Query(..., description="End date for the period"),
+    current_user: CurrentUser = Depends(get_current_user),
+    config: AppConfig = Depends(get_config)
+):
+    """Stream the complementary comparisons of the multi-JIRA overview as NDJSON, one ComplementaryComparison per line."""
+    company_id = current_user.company_id
+    users, all_emails, jira_instances, _ = await _multi_jira_context(
+        start_date, end_date, company_id, config.settings.daily_working_hours
     )
+    return _ndjson_stream(_iter_complementary_comparisons(
+        jira_instances, users, all_emails, start_date, end_date, company_id, {}
+    ))
@@ -7,12 +7,12 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 
 from ..models import (
     EpicListResponse, EpicDetailResponse, EpicHours, UserHours,
-    DailyHours, Worklog, AppConfig, IssueListResponse, IssueListItem
+    DailyHours, Worklog, AppConfig, IssueListResponse, IssueListItem, WorklogColumns
 )
 from ..config import get_config, get_users_from_db, get_complementary_instances_from_db
 from ..cache import get_storage
 from ..auth.dependencies import get_current_user, CurrentUser
-from .dashboard import calculate_daily_trend, calculate_epic_hours
+from .dashboard import calculate_daily_trend, calculate_daily_trend_columns, calculate_epic_hours, model_response
 
 router = APIRouter(prefix="/api/epics", tags=["epics"])
 
@@ -60,10 +60,10 @@ async def list_epics(
     # Total hours across all epics
     total_hours = sum(e.total_hours for e in epic_hours)
 
-    return EpicListResponse(
+    return model_response(EpicListResponse(
         epics=epic_hours,
         total_hours=round(total_hours, 2)
-    )
+    ))
 
 
 @router.get("/issues", response_model=IssueListResponse)
@@ -93,7 +93,7 @@ async def list_issues(
     issue_data = defaultdict(lambda: {
         "summary": "Unknown",
         "instance": "",
-        "hours": 0,
+        "seconds": 0,
         "contributors": set(),
         "parent_key": None,
         "parent_name": None,
@@ -104,7 +104,7 @@ async def list_issues(
         key = wl.issue_key
         issue_data[key]["summary"] = wl.issue_summary or "Unknown"
         issue_data[key]["instance"] = wl.jira_instance
-        issue_data[key]["hours"] += wl.time_spent_seconds / 3600
+        issue_data[key]["seconds"] += wl.time_spent_seconds
         issue_data[key]["contributors"].add(wl.author_email)
         if wl.parent_key:
             issue_data[key]["parent_key"] = wl.parent_key
@@ -113,11 +113,11 @@ async def list_issues(
 
     result = []
     for issue_key, data in issue_data.items():
-        result.append(IssueListItem(
+        result.append(IssueListItem.model_construct(
             issue_key=issue_key,
             issue_summary=data["summary"],
             jira_instance=data["instance"],
-            total_hours=round(data["hours"], 2),
+            total_hours=round(data["seconds"] / 3600, 2),
             contributor_count=len(data["contributors"]),
             parent_key=data["parent_key"],
             parent_name=data["parent_name"],
@@ -127,11 +127,11 @@ async def list_issues(
     result.sort(key=lambda x: x.total_hours, reverse=True)
     total_hours = sum(i.total_hours for i in result)
 
-    return IssueListResponse(
+    return model_response(IssueListResponse(
         issues=result,
         total_hours=round(total_hours, 2),
         total_count=len(result)
-    )
+    ))
 
 
 @router.get("/{epic_key}", response_model=EpicDetailResponse)
@@ -139,6 +139,7 @@ async def get_epic_detail(
     epic_key: str,
     start_date: date = Query(..., description="Start date for the period"),
     end_date: date = Query(..., description="End date for the period"),
+    columnar: bool = Query(False, description="Return worklogs and daily trend as worklog_columns / daily_trend_columns"),
     current_user: CurrentUser = Depends(get_current_user),
     config: AppConfig = Depends(get_config)
 ):
@@ -164,15 +165,17 @@ async def get_epic_detail(
 
     # Handle empty worklogs - return empty response instead of 404
     if not initiative_worklogs:
-        return EpicDetailResponse(
+        return model_response(EpicDetailResponse(
             epic_key=epic_key,
             epic_name="Iniziativa sconosciuta",
             jira_instance="unknown",
             total_hours=0,
             contributors=[],
-            daily_trend=calculate_daily_trend([], start_date, end_date),
-            worklogs=[]
-        )
+            daily_trend=[] if columnar else calculate_daily_trend([], start_date, end_date),
+            daily_trend_columns=calculate_daily_trend_columns([], start_date, end_date) if columnar else None,
+            worklogs=[],
+            worklog_columns=WorklogColumns() if columnar else None
+        ))
 
     # Get initiative info from first worklog (prefer parent_key data)
     first_wl = initiative_worklogs[0]
@@ -190,7 +193,10 @@ async def get_epic_detail(
     contributors = await calculate_contributors_from_db(initiative_worklogs, users)
 
     # Daily trend
-    daily_trend = calculate_daily_trend(initiative_worklogs, start_date, end_date)
+    if columnar:
+        daily_trend, daily_trend_columns = [], calculate_daily_trend_columns(initiative_worklogs, start_date, end_date)
+    else:
+        daily_trend, daily_trend_columns = calculate_daily_trend(initiative_worklogs, start_date, end_date), None
 
     # Enrich worklogs with resolved author names from database
     enriched_worklogs = enrich_worklogs_with_names(initiative_worklogs, users)
@@ -198,15 +204,17 @@ async def get_epic_detail(
     # Sort worklogs by date (newest first)
     sorted_worklogs = sorted(enriched_worklogs, key=lambda w: w.started, reverse=True)
 
-    return EpicDetailResponse(
+    return model_response(EpicDetailResponse(
         epic_key=epic_key,
         epic_name=epic_name,
         jira_instance=jira_instance,
         total_hours=round(total_hours, 2),
         contributors=contributors,
         daily_trend=daily_trend,
-        worklogs=sorted_worklogs
-    )
+        daily_trend_columns=daily_trend_columns,
+        worklogs=[] if columnar else sorted_worklogs,
+        worklog_columns=WorklogColumns.from_rows(sorted_worklogs) if columnar else None
+    ))
 
 
 def enrich_worklogs_with_names(worklogs: list[Worklog], users: list[dict]) -> list[Worklog]:
@@ -224,7 +232,7 @@ def enrich_worklogs_with_names(worklogs: list[Worklog], users: list[dict]) -> li
         resolved_name = email_to_name.get(email_lower, wl.author_display_name or wl.author_email)
 
         # Create enriched worklog with resolved name
-        enriched.append(Worklog(
+        enriched.append(Worklog.model_construct(
             id=wl.id,
             issue_key=wl.issue_key,
             issue_summary=wl.issue_summary,
@@ -256,11 +264,11 @@ async def calculate_contributors_from_db(worklogs: list[Worklog], users: list[di
             "role": u.get("role")
         }
 
-    contributor_data = defaultdict(lambda: {"hours": 0, "name": "Unknown", "user_id": None})
+    contributor_data = defaultdict(lambda: {"seconds": 0, "name": "Unknown", "user_id": None})
 
     for wl in worklogs:
         email = wl.author_email.lower()
-        contributor_data[email]["hours"] += wl.time_spent_seconds / 3600
+        contributor_data[email]["seconds"] += wl.time_spent_seconds
 
         # Get display name and user_id from database or worklog
         if email in email_to_data:
@@ -274,12 +282,12 @@ async def calculate_contributors_from_db(worklogs: list[Worklog], users: list[di
         user_data = email_to_data.get(email, {})
         team_name = user_data.get("team", "External")
         role = user_data.get("role")
-        result.append(UserHours(
+        result.append(UserHours.model_construct(
             email=email,
             user_id=data["user_id"],
             full_name=data["name"],
             role=role,
-            total_hours=round(data["hours"], 2),
+            total_hours=round(data["seconds"] / 3600, 2),
             team_name=team_name or "External"
         ))
 
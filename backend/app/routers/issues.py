@@ -7,13 +7,16 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 from pydantic import BaseModel
 from typing import Optional
 
-from ..models import AppConfig, Worklog, DailyHours
-from ..config import get_config, get_users_from_db
+from ..models import AppConfig, Worklog, DailyHours, UserHours
+from ..config import get_config, get_users_from_db, invalidate_dashboard_responses
 from ..cache import get_storage
 from ..auth.dependencies import get_current_user, require_admin, CurrentUser
+from .dashboard import model_response
 
 router = APIRouter(prefix="/api/issues", tags=["issues"])
 
+_make_daily_hours = DailyHours.model_construct
+
 
 def enrich_worklogs_with_user_data(worklogs: list[Worklog], users: list[dict]) -> list[Worklog]:
     """Enrich worklogs with user IDs from database."""
@@ -25,7 +28,7 @@ def enrich_worklogs_with_user_data(worklogs: list[Worklog], users: list[dict]) -
         email_lower = wl.author_email.lower()
         user_id = email_to_user_id.get(email_lower)
 
-        enriched.append(Worklog(
+        enriched.append(Worklog.model_construct(
             id=wl.id,
             issue_key=wl.issue_key,
             issue_summary=wl.issue_summary,
@@ -45,14 +48,6 @@ def enrich_worklogs_with_user_data(worklogs: list[Worklog], users: list[dict]) -
     return enriched
 
 
-class UserHours(BaseModel):
-    """Hours worked by a user on this issue."""
-    email: str
-    user_id: Optional[int] = None
-    display_name: str
-    total_hours: float
-
-
 class IssueDetailResponse(BaseModel):
     """Response for issue detail view."""
     issue_key: str
@@ -97,7 +92,7 @@ async def get_issue_detail(
 
     # Get users from database for user_id mapping (scoped to company)
     users = await get_users_from_db(current_user.company_id)
-    email_to_user_id = {u["email"].lower(): u["id"] for u in users}
+    email_to_user = {u["email"].lower(): u for u in users}
 
     # Get all worklogs for this issue (scoped to company)
     all_worklogs = await storage.get_worklogs_in_range(start_date, end_date, company_id=current_user.company_id)
@@ -105,7 +100,7 @@ async def get_issue_detail(
 
     # Handle empty worklogs - return empty response instead of 404
     if not issue_worklogs:
-        return IssueDetailResponse(
+        return model_response(IssueDetailResponse(
             issue_key=issue_key,
             issue_summary="Issue sconosciuta",
             jira_instance="unknown",
@@ -118,7 +113,7 @@ async def get_issue_detail(
             contributors=[],
             daily_trend=[],
             worklogs=[]
-        )
+        ))
 
     # Get issue metadata from first worklog
     first_wl = issue_worklogs[0]
@@ -140,28 +135,29 @@ async def get_issue_detail(
         contributor_hours[wl.author_email]["display_name"] = wl.author_display_name
         contributor_hours[wl.author_email]["seconds"] += wl.time_spent_seconds
 
-    contributors = [
-        UserHours(
+    contributors = []
+    for email, data in sorted(
+        contributor_hours.items(),
+        key=lambda x: x[1]["seconds"],
+        reverse=True
+    ):
+        user = email_to_user.get(email.lower())
+        contributors.append(UserHours.model_construct(
             email=email,
-            user_id=email_to_user_id.get(email.lower()),
-            display_name=data["display_name"],
-            total_hours=data["seconds"] / 3600
-        )
-        for email, data in sorted(
-            contributor_hours.items(),
-            key=lambda x: x[1]["seconds"],
-            reverse=True
-        )
-    ]
+            user_id=user["id"] if user else None,
+            full_name=f"{user['first_name']} {user['last_name']}" if user else data["display_name"],
+            role=user.get("role") if user else None,
+            total_hours=data["seconds"] / 3600,
+            team_name=(user.get("team_name") if user else None) or "External"
+        ))
 
-    # Calculate daily trend
+    # Calculate daily trend (bucketed by day ordinal)
     daily_seconds = defaultdict(int)
     for wl in issue_worklogs:
-        day = wl.started.date().isoformat()
-        daily_seconds[day] += wl.time_spent_seconds
+        daily_seconds[wl.started.toordinal()] += wl.time_spent_seconds
 
     daily_trend = [
-        DailyHours(date=d, hours=s / 3600)
+        _make_daily_hours(date=date.fromordinal(d), hours=s / 3600)
         for d, s in sorted(daily_seconds.items())
     ]
 
@@ -171,7 +167,7 @@ async def get_issue_detail(
     # Sort worklogs by date (most recent first)
     sorted_worklogs = sorted(enriched_worklogs, key=lambda w: w.started, reverse=True)
 
-    return IssueDetailResponse(
+    return model_response(IssueDetailResponse(
         issue_key=issue_key,
         issue_summary=issue_summary,
         jira_instance=jira_instance,
@@ -184,7 +180,7 @@ async def get_issue_detail(
         contributors=contributors,
         daily_trend=daily_trend,
         worklogs=sorted_worklogs
-    )
+    ))
 
 
 @router.post("/{issue_key}/sync", response_model=IssueSyncResponse)
@@ -306,6 +302,7 @@ async def sync_issue_worklogs(
 
     # Save to database (with company_id)
     inserted, updated = await storage.upsert_worklogs(worklogs_to_save, current_user.company_id)
+    invalidate_dashboard_responses(current_user.company_id)
 
     return IssueSyncResponse(
         success=True,
@@ -343,7 +343,7 @@ async def create_package(
                 child_group_id = str(uuid.uuid4())
                 for result in results:
                     if element_idx < len(result.children):
-                        child_key = result.children[element_idx].get("key")
+                        child_key = result.children[element_idx].key
                         if child_key:
                             links_to_save.append({
                                 "link_group_id": child_group_id,
@@ -10,8 +10,8 @@ logger = logging.getLogger(__name__)
 
 from ..models import (
     AppConfig, UserRole,
-    TeamCreate, TeamUpdate, TeamInDB, TeamWithMembers,
-    UserCreate, UserUpdate, UserInDB,
+    TeamCreate, TeamUpdate, TeamInDBCore, TeamInDB, TeamWithMembers,
+    UserCreate, UserUpdate, UserInDBCore, UserInDB,
     FetchAccountIdRequest, FetchAccountIdResponse,
     ImportConfigResponse,
     BulkUserCreateRequest, BulkUserCreateResult, BulkUserCreateResponse,
@@ -21,7 +21,7 @@ from ..models import (
     JiraExclusionCreate,
     GenericIssueCreate,
 )
-from ..config import get_config
+from ..config import get_config, invalidate_config_info, invalidate_dashboard_responses, invalidate_me_responses
 from ..cache import get_storage
 from ..jira_client import JiraClient
 from ..auth.dependencies import get_current_user, require_admin, CurrentUser
@@ -31,12 +31,12 @@ router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 # ========== Teams Endpoints ==========
 
-@router.get("/teams", response_model=list[TeamInDB])
+@router.get("/teams", response_model=list[TeamInDBCore])
 async def list_teams(current_user: CurrentUser = Depends(get_current_user)):
     """List all teams with member counts for current user's company."""
     storage = get_storage()
     teams = await storage.get_all_teams(current_user.company_id)
-    return [TeamInDB(**t) for t in teams]
+    return [TeamInDBCore(**t) for t in teams]
 
 
 @router.post("/teams", response_model=TeamInDB)
@@ -50,6 +50,7 @@ async def create_team(team: TeamCreate, current_user: CurrentUser = Depends(requ
         raise HTTPException(status_code=400, detail="Team name already exists")
 
     team_id = await storage.create_team(team.name, current_user.company_id, owner_id=team.owner_id)
+    invalidate_config_info(current_user.company_id)
     created = await storage.get_team_with_owner(team_id, current_user.company_id)
     return TeamInDB(**created, member_count=0)
 
@@ -93,6 +94,8 @@ async def update_team(team_id: int, team: TeamUpdate, current_user: CurrentUser
         owner_value = team.owner_id if team.owner_id > 0 else None
         await storage.update_team_owner(team_id, owner_value, current_user.company_id)
 
+    invalidate_config_info(current_user.company_id)
+
     teams = await storage.get_all_teams(current_user.company_id)
     team_data = next((t for t in teams if t["id"] == team_id), None)
     if not team_data:
@@ -110,25 +113,24 @@ async def delete_team(team_id: int, current_user: CurrentUser = Depends(require_
         raise HTTPException(status_code=404, detail="Team not found")
 
     await storage.delete_team(team_id, current_user.company_id)
+    invalidate_config_info(current_user.company_id)
     return {"success": True, "message": "Team deleted"}
 
 
 # ========== Users Endpoints ==========
 
-@router.get("/users", response_model=list[UserInDB])
+@router.get("/users", response_model=list[UserInDBCore])
 async def list_users(current_user: CurrentUser = Depends(get_current_user)):
     """List all users with team info and JIRA accounts for current user's company."""
     storage = get_storage()
     users = await storage.get_all_users(current_user.company_id)
-    return [UserInDB(
+    return [UserInDBCore(
         id=u["id"],
         email=u["email"],
         first_name=u["first_name"],
         last_name=u["last_name"],
         team_id=u["team_id"],
         team_name=u["team_name"],
-        created_at=u["created_at"],
-        updated_at=u["updated_at"],
         jira_accounts=u["jira_accounts"]
     ) for u in users]
 
@@ -156,6 +158,7 @@ async def create_user(user: UserCreate, current_user: CurrentUser = Depends(requ
         team_id=user.team_id,
         company_id=current_user.company_id
     )
+    invalidate_config_info(current_user.company_id)
     created = await storage.get_user(user_id, current_user.company_id)
     return UserInDB(
         id=created["id"],
@@ -227,6 +230,7 @@ async def update_user(user_id: int, user: UserUpdate, current_user: CurrentUser
 
     if update_data:
         await storage.update_user(user_id, current_user.company_id, **update_data)
+        invalidate_config_info(current_user.company_id)
 
     updated = await storage.get_user(user_id, current_user.company_id)
     return UserInDB(
@@ -257,6 +261,7 @@ async def delete_user(user_id: int, current_user: CurrentUser = Depends(require_
         raise HTTPException(status_code=404, detail="User not found")
 
     await storage.delete_user(user_id, current_user.company_id)
+    invalidate_config_info(current_user.company_id)
     return {"success": True, "message": "User deactivated (soft delete)"}
 
 
@@ -275,6 +280,7 @@ async def reactivate_user(user_id: int, current_user: CurrentUser = Depends(requ
     if not success:
         raise HTTPException(status_code=404, detail="User not found or already active")
 
+    invalidate_config_info(current_user.company_id)
     return {"success": True, "message": "User reactivated"}
 
 
@@ -406,6 +412,9 @@ async def create_users_bulk(
             ))
             failed_count += 1
 
+    if created_count:
+        invalidate_config_info(current_user.company_id)
+
     return BulkUserCreateResponse(
         total=len(results),
         created=created_count,
@@ -664,6 +673,8 @@ async def import_from_config(
             )
             jira_instances_created += 1
 
+    invalidate_config_info(current_user.company_id)
+
     return ImportConfigResponse(
         teams_created=result["teams_created"],
         users_created=result["users_created"],
@@ -710,6 +721,7 @@ async def create_jira_instance(data: dict, current_user: CurrentUser = Depends(r
         billing_client_id=billing_client_id,
         company_id=current_user.company_id
     )
+    invalidate_config_info(current_user.company_id)
 
     instance = await storage.get_jira_instance(instance_id, current_user.company_id)
 
@@ -791,6 +803,7 @@ async def update_jira_instance(
             raise HTTPException(status_code=400, detail="Instance name already exists")
 
     await storage.update_jira_instance(instance_id, current_user.company_id, **data)
+    invalidate_config_info(current_user.company_id)
 
     updated = await storage.get_jira_instance(instance_id, current_user.company_id)
     return {
@@ -814,6 +827,7 @@ async def delete_jira_instance(instance_id: int, current_user: CurrentUser = Dep
         raise HTTPException(status_code=404, detail="Instance not found")
 
     await storage.delete_jira_instance(instance_id, current_user.company_id)
+    invalidate_config_info(current_user.company_id)
     return {"success": True, "message": "Instance deleted"}
 
 
@@ -906,6 +920,7 @@ async def create_complementary_group(data: dict, current_user: CurrentUser = Dep
         instance = await storage.get_jira_instance(instance_id, current_user.company_id)
         if instance:
             await storage.add_instance_to_complementary_group(group_id, instance_id, current_user.company_id)
+    invalidate_dashboard_responses(current_user.company_id)
 
     group = await storage.get_complementary_group(group_id, current_user.company_id)
     return group
@@ -948,6 +963,7 @@ async def update_complementary_group(
     # Update members if provided
     if "member_ids" in data:
         await storage.set_complementary_group_members(group_id, data["member_ids"], current_user.company_id)
+    invalidate_dashboard_responses(current_user.company_id)
 
     updated = await storage.get_complementary_group(group_id, current_user.company_id)
     return updated
@@ -963,6 +979,7 @@ async def delete_complementary_group(group_id: int, current_user: CurrentUser =
         raise HTTPException(status_code=404, detail="Group not found")
 
     await storage.delete_complementary_group(group_id, current_user.company_id)
+    invalidate_dashboard_responses(current_user.company_id)
     return {"success": True, "message": "Group deleted"}
 
 
@@ -988,6 +1005,7 @@ async def add_member_to_group(
     added = await storage.add_instance_to_complementary_group(group_id, instance_id, current_user.company_id)
     if not added:
         raise HTTPException(status_code=400, detail="Instance already in group")
+    invalidate_dashboard_responses(current_user.company_id)
 
     return {"success": True, "message": "Instance added to group"}
 
@@ -1009,6 +1027,7 @@ async def remove_member_from_group(
     removed = await storage.remove_instance_from_complementary_group(group_id, instance_id, current_user.company_id)
     if not removed:
         raise HTTPException(status_code=404, detail="Instance not in group")
+    invalidate_dashboard_responses(current_user.company_id)
 
     return {"success": True, "message": "Instance removed from group"}
 
@@ -1049,6 +1068,7 @@ async def get_holidays(year: int, country: str = "IT", current_user: CurrentUser
     if not holidays:
         inserted = await storage.seed_holidays_for_year(year, current_user.company_id, country)
         if inserted > 0:
+            invalidate_dashboard_responses(current_user.company_id)
             holidays = await storage.get_holidays_for_year(year, current_user.company_id, country)
 
     active_count = sum(1 for h in holidays if h["is_active"])
@@ -1073,6 +1093,7 @@ async def create_holiday(data: HolidayCreate, current_user: CurrentUser = Depend
         )
     except Exception:
         raise HTTPException(status_code=400, detail="Holiday already exists for this date")
+    invalidate_dashboard_responses(current_user.company_id)
 
     return {"id": holiday_id, "success": True}
 
@@ -1095,6 +1116,7 @@ async def update_holiday(
     updated = await storage.update_holiday(holiday_id, current_user.company_id, **update_fields)
     if not updated:
         raise HTTPException(status_code=404, detail="Holiday not found")
+    invalidate_dashboard_responses(current_user.company_id)
 
     return {"success": True}
 
@@ -1107,6 +1129,7 @@ async def delete_holiday(holiday_id: int, current_user: CurrentUser = Depends(re
     deleted = await storage.delete_holiday(holiday_id, current_user.company_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Holiday not found")
+    invalidate_dashboard_responses(current_user.company_id)
 
     return {"success": True}
 
@@ -1116,6 +1139,7 @@ async def seed_holidays(year: int, country: str = "IT", current_user: CurrentUse
     """Re-seed default holidays for a year (won't duplicate existing) (ADMIN only)."""
     storage = get_storage()
     inserted = await storage.seed_holidays_for_year(year, current_user.company_id, country)
+    invalidate_dashboard_responses(current_user.company_id)
     return {"inserted": inserted, "year": year, "country": country}
 
 
@@ -1155,6 +1179,7 @@ async def execute_migration(
 
     try:
         result = await storage.migrate_legacy_data(target_company_id)
+        invalidate_dashboard_responses(target_company_id)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -1185,6 +1210,7 @@ async def clear_all_worklogs(
     try:
         # Delete all worklogs for this company
         deleted_count = await storage.delete_all_worklogs(current_user.company_id)
+        invalidate_dashboard_responses(current_user.company_id)
 
         logger.info(
             f"Admin {current_user.email} (company_id={current_user.company_id}) "
@@ -1245,6 +1271,8 @@ async def migrate_roles(current_user: CurrentUser = Depends(require_admin)):
         )
         role_counts = {row[0]: row[1] for row in await cursor.fetchall()}
 
+    invalidate_me_responses(company_id=current_user.company_id)
+
     return {
         "success": True,
         "migrated_from_user_to_dev": user_role_count,
@@ -1294,6 +1322,7 @@ async def update_matching_algorithm(
         config=update_data.config,
         priority=update_data.priority
     )
+    invalidate_dashboard_responses(current_user.company_id)
 
     return {
         "success": True,
@@ -1326,6 +1355,7 @@ async def add_jira_exclusion(
         exclusion_data.exclusion_type,
         exclusion_data.description
     )
+    invalidate_dashboard_responses(current_user.company_id)
 
     return {
         "success": True,
@@ -1342,6 +1372,7 @@ async def delete_jira_exclusion(
     storage = get_storage()
 
     await storage.delete_jira_exclusion(current_user.company_id, exclusion_id)
+    invalidate_dashboard_responses(current_user.company_id)
 
     return {"success": True}
 
@@ -1373,6 +1404,7 @@ async def create_generic_issue(
         generic_issue_data.team_id,
         generic_issue_data.description
     )
+    invalidate_dashboard_responses(current_user.company_id)
 
     return {
         "success": True,
@@ -1389,6 +1421,7 @@ async def delete_generic_issue(
     storage = get_storage()
 
     await storage.delete_generic_issue(current_user.company_id, generic_issue_id)
+    invalidate_dashboard_responses(current_user.company_id)
 
     return {"success": True}
 
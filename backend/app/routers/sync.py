@@ -10,7 +10,7 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ..models import AppConfig
-from ..config import get_config, get_users_from_db, get_jira_instances_from_db
+from ..config import get_config, get_users_from_db, get_jira_instances_from_db, invalidate_dashboard_responses
 from ..cache import get_storage
 from ..auth.dependencies import require_admin, CurrentUser
 from ..jira_client import JiraService
@@ -251,6 +251,7 @@ async def sync_worklogs(
             total_updated,
             total_deleted
         )
+        invalidate_dashboard_responses(current_user.company_id)
         
         return SyncResponse(
             success=True,
@@ -264,6 +265,7 @@ async def sync_worklogs(
     except Exception as e:
         # Record sync failure
         await storage.complete_sync(sync_id, current_user.company_id, 0, 0, 0, error=str(e))
+        invalidate_dashboard_responses(current_user.company_id)
         raise HTTPException(status_code=500, detail=f"Sync failed: {str(e)}")
 
 
@@ -555,6 +557,7 @@ async def sync_worklogs_stream(
                 total_updated,
                 total_deleted
             )
+            invalidate_dashboard_responses(current_user.company_id)
 
             yield json.dumps({
                 "type": "complete",
@@ -567,6 +570,7 @@ async def sync_worklogs_stream(
 
         except Exception as e:
             await storage.complete_sync(sync_id, current_user.company_id, 0, 0, 0, error=str(e))
+            invalidate_dashboard_responses(current_user.company_id)
             yield json.dumps({"type": "error", "message": str(e)}) + "\n"
 
     return StreamingResponse(
@@ -17,7 +17,7 @@ from ..config import (
 )
 from ..cache import get_storage
 from ..auth.dependencies import get_current_user, CurrentUser
-from .dashboard import calculate_expected_hours, calculate_daily_trend, calculate_epic_hours
+from .dashboard import calculate_expected_hours, calculate_daily_trend, calculate_epic_hours, model_response
 
 router = APIRouter(prefix="/api/teams", tags=["teams"])
 
@@ -138,7 +138,7 @@ async def get_team_detail(
     # Sort worklogs by date (newest first) and limit to recent 100
     sorted_worklogs = sorted(worklogs, key=lambda w: w.started, reverse=True)[:100]
 
-    return TeamDetailResponse(
+    return model_response(TeamDetailResponse(
         team_name=team_data["name"],
         total_hours=round(total_hours, 2),
         expected_hours=round(expected_hours, 2),
@@ -146,7 +146,7 @@ async def get_team_detail(
         epics=epic_hours,
         daily_trend=daily_trend,
         worklogs=sorted_worklogs
-    )
+    ))
 
 
 @router.get("/{team_name}/multi-jira-overview", response_model=MultiJiraOverviewResponse)
@@ -216,7 +216,7 @@ async def get_team_multi_jira_overview(
         daily_trend = calculate_daily_trend(worklogs, start_date, end_date)
         instance_members = calculate_member_hours_from_db(worklogs, team_members, team_data["name"])
 
-        instances_overview.append(InstanceOverview(
+        instances_overview.append(InstanceOverview.model_construct(
             instance_name=inst.name,
             total_hours=round(total_hours, 2),
             expected_hours=round(expected_hours, 2),
@@ -243,24 +243,24 @@ async def get_team_multi_jira_overview(
             primary_total = sum(w.time_spent_seconds for w in primary_wls) / 3600
             secondary_total = sum(w.time_spent_seconds for w in secondary_wls) / 3600
 
-            primary_by_init = defaultdict(lambda: {"hours": 0, "name": ""})
+            primary_by_init = defaultdict(lambda: {"seconds": 0, "name": ""})
             for w in primary_wls:
                 if w.parent_key:
-                    primary_by_init[w.parent_key]["hours"] += w.time_spent_seconds / 3600
+                    primary_by_init[w.parent_key]["seconds"] += w.time_spent_seconds
                     primary_by_init[w.parent_key]["name"] = w.parent_name or w.parent_key
 
-            secondary_by_init = defaultdict(lambda: {"hours": 0, "name": ""})
+            secondary_by_init = defaultdict(lambda: {"seconds": 0, "name": ""})
             for w in secondary_wls:
                 if w.parent_key:
-                    secondary_by_init[w.parent_key]["hours"] += w.time_spent_seconds / 3600
+                    secondary_by_init[w.parent_key]["seconds"] += w.time_spent_seconds
                     secondary_by_init[w.parent_key]["name"] = w.parent_name or w.parent_key
 
             all_keys = set(primary_by_init.keys()) | set(secondary_by_init.keys())
             discrepancies = []
 
             for key in all_keys:
-                p_hours = primary_by_init[key]["hours"] if key in primary_by_init else 0
-                s_hours = secondary_by_init[key]["hours"] if key in secondary_by_init else 0
+                p_hours = primary_by_init[key]["seconds"] / 3600 if key in primary_by_init else 0
+                s_hours = secondary_by_init[key]["seconds"] / 3600 if key in secondary_by_init else 0
                 delta = abs(p_hours - s_hours)
                 max_hours = max(p_hours, s_hours)
                 delta_pct = (delta / max_hours * 100) if max_hours > 0 else 0
@@ -268,7 +268,7 @@ async def get_team_multi_jira_overview(
                 if delta > 1 or delta_pct > 10:
                     name = (primary_by_init.get(key, {}).get("name") or
                             secondary_by_init.get(key, {}).get("name") or key)
-                    discrepancies.append(DiscrepancyItem(
+                    discrepancies.append(DiscrepancyItem.model_construct(
                         initiative_key=key,
                         initiative_name=name,
                         primary_hours=round(p_hours, 2),
@@ -288,20 +288,20 @@ async def get_team_multi_jira_overview(
                 discrepancies=discrepancies
             ))
 
-    return MultiJiraOverviewResponse(
+    return model_response(MultiJiraOverviewResponse(
         instances=instances_overview,
         complementary_comparisons=complementary_comparisons,
         period_start=start_date,
         period_end=end_date
-    )
+    ))
 
 
 def calculate_member_hours_from_db(worklogs: list[Worklog], team_members: list[dict], team_name: str) -> list[UserHours]:
     """Calculate hours per team member (using database data)."""
-    member_data = defaultdict(float)
+    member_seconds = defaultdict(int)
 
     for wl in worklogs:
-        member_data[wl.author_email.lower()] += wl.time_spent_seconds / 3600
+        member_seconds[wl.author_email.lower()] += wl.time_spent_seconds
 
     result = []
     for member in team_members:
@@ -309,8 +309,8 @@ def calculate_member_hours_from_db(worklogs: list[Worklog], team_members: list[d
         user_id = member.get("id")
         full_name = f"{member['first_name']} {member['last_name']}"
         role = member.get("role")
-        hours = member_data.get(email.lower(), 0)
-        result.append(UserHours(
+        hours = member_seconds.get(email.lower(), 0) / 3600
+        result.append(UserHours.model_construct(
             email=email,
             user_id=user_id,
             full_name=full_name,
@@ -7,12 +7,16 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 
 from ..models import (
     UserDetailResponse, UserHours, EpicHours, DailyHours, Worklog,
-    AppConfig
+    AppConfig, WorklogColumns
 )
 from ..config import get_config, get_users_from_db, get_complementary_instances_from_db
 from ..cache import get_storage
 from ..auth.dependencies import get_current_user, CurrentUser
-from .dashboard import calculate_expected_hours, calculate_daily_trend, calculate_daily_trend_by_instance, calculate_epic_hours
+from .dashboard import (
+    calculate_expected_hours, calculate_daily_trend, calculate_daily_trend_columns, calculate_daily_trend_by_instance,
+    calculate_daily_trend_by_instance_matrix, calculate_epic_hours,
+    instance_table, instance_row_to_dict, model_response
+)
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
@@ -36,7 +40,7 @@ def enrich_worklogs_with_user_data(worklogs: list[Worklog], users: list[dict]) -
         resolved_name = user_data["name"] if user_data else (wl.author_display_name or wl.author_email)
         user_id = user_data["user_id"] if user_data else None
 
-        enriched.append(Worklog(
+        enriched.append(Worklog.model_construct(
             id=wl.id,
             issue_key=wl.issue_key,
             issue_summary=wl.issue_summary,
@@ -104,16 +108,16 @@ async def list_users(
             worklogs = [w for w in worklogs if w.jira_instance not in secondary_instances]
 
     # Build per-user stats
-    user_hours = defaultdict(float)
-    user_instance_hours = defaultdict(lambda: defaultdict(float))
+    user_seconds = defaultdict(int)
+    instance_names, instance_index = instance_table(all_worklogs)
+    user_instance_seconds: dict[str, list] = {}
     user_worklog_count = defaultdict(int)
     user_initiatives = defaultdict(set)
 
     # Calculate Totals from FILTERED worklogs (deduplicated)
     for wl in worklogs:
         email_lower = wl.author_email.lower()
-        hours = wl.time_spent_seconds / 3600
-        user_hours[email_lower] += hours
+        user_seconds[email_lower] += wl.time_spent_seconds
         user_worklog_count[email_lower] += 1
         if wl.parent_key:
             user_initiatives[email_lower].add(wl.parent_key)
@@ -121,8 +125,12 @@ async def list_users(
     # Calculate Instance Breakdown from ALL worklogs (complete view)
     for wl in all_worklogs:
         email_lower = wl.author_email.lower()
-        hours = wl.time_spent_seconds / 3600
-        user_instance_hours[email_lower][wl.jira_instance] += hours
+        seconds = wl.time_spent_seconds
+        row = user_instance_seconds.get(email_lower)
+        if row is None:
+            row = user_instance_seconds[email_lower] = [None] * len(instance_names)
+        idx = instance_index[wl.jira_instance]
+        row[idx] = seconds if row[idx] is None else row[idx] + seconds
         user_worklog_count[email_lower] += 1
         if wl.parent_key:
             user_initiatives[email_lower].add(wl.parent_key)
@@ -138,11 +146,11 @@ async def list_users(
     result = []
     for u in users:
         email_lower = u["email"].lower()
-        total_hours = round(user_hours.get(email_lower, 0), 2)
+        total_hours = round(user_seconds.get(email_lower, 0) / 3600, 2)
         completion = round((total_hours / expected_hours_per_user * 100), 1) if expected_hours_per_user > 0 else 0
         
         # Round instance hours
-        instance_hours = {k: round(v, 2) for k, v in user_instance_hours.get(email_lower, {}).items()}
+        instance_hours = instance_row_to_dict(instance_names, user_instance_seconds.get(email_lower))
 
         result.append({
             "id": u["id"],
@@ -168,6 +176,7 @@ async def get_user_detail(
     start_date: date = Query(..., description="Start date for the period"),
     end_date: date = Query(..., description="End date for the period"),
     jira_instance: str = Query(None, description="Filter by JIRA instance name"),
+    columnar: bool = Query(False, description="Return worklogs and daily trends as worklog_columns / daily_trend_columns / daily_trend_by_instance_soa"),
     current_user: CurrentUser = Depends(get_current_user),
     config: AppConfig = Depends(get_config)
 ):
@@ -236,10 +245,16 @@ async def get_user_detail(
     epic_hours = calculate_epic_hours(filtered_worklogs)
 
     # Daily trend (filtered, for correct totals)
-    daily_trend = calculate_daily_trend(filtered_worklogs, start_date, end_date)
+    if columnar:
+        daily_trend, daily_trend_columns = [], calculate_daily_trend_columns(filtered_worklogs, start_date, end_date)
+    else:
+        daily_trend, daily_trend_columns = calculate_daily_trend(filtered_worklogs, start_date, end_date), None
 
     # Daily trend by instance (all worklogs, for multi-line chart)
-    daily_trend_by_instance = calculate_daily_trend_by_instance(all_worklogs, start_date, end_date)
+    if columnar:
+        daily_trend_by_instance, daily_trend_by_instance_soa = {}, calculate_daily_trend_by_instance_matrix(all_worklogs, start_date, end_date)
+    else:
+        daily_trend_by_instance, daily_trend_by_instance_soa = calculate_daily_trend_by_instance(all_worklogs, start_date, end_date), None
 
     # Enrich all worklogs with resolved author names and user IDs (for calendar)
     enriched_worklogs = enrich_worklogs_with_user_data(all_worklogs, users)
@@ -247,7 +262,7 @@ async def get_user_detail(
     # Sort worklogs by date (newest first)
     sorted_worklogs = sorted(enriched_worklogs, key=lambda w: w.started, reverse=True)
 
-    return UserDetailResponse(
+    return model_response(UserDetailResponse(
         email=email,
         user_id=user_internal_id,
         full_name=full_name,
@@ -256,6 +271,9 @@ async def get_user_detail(
         expected_hours=round(expected_hours, 2),
         epics=epic_hours,
         daily_trend=daily_trend,
+        daily_trend_columns=daily_trend_columns,
         daily_trend_by_instance=daily_trend_by_instance,
-        worklogs=sorted_worklogs
-    )
+        daily_trend_by_instance_soa=daily_trend_by_instance_soa,
+        worklogs=[] if columnar else sorted_worklogs,
+        worklog_columns=WorklogColumns.from_rows(sorted_worklogs) if columnar else None
+    ))
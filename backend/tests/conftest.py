@@ -3,6 +3,8 @@ Pytest configuration and fixtures for multi-tenant tests.
 """
 import os
 import asyncio
+import sqlite3
+from datetime import datetime
 import pytest
 from httpx import AsyncClient
 
@@ -13,9 +15,14 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # Use test database
 os.environ["DB_PATH"] = "test_worklog_storage.db"
 
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "migrations")
+
 from app.main import app
+from app import cache as cache_module
 from app.cache import WorklogStorage
 from app.auth.jwt import create_access_token
+from app.config import invalidate_config_info, invalidate_me_responses
+from app.models import Worklog
 
 
 @pytest.fixture(scope="session")
@@ -117,3 +124,73 @@ async def client():
     """Create async HTTP client for testing."""
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
+
+
+@pytest.fixture
+async def seeded_company(storage, monkeypatch):
+    """
+    Company served by the app's storage, with an ADMIN user, two team members,
+    instances Alpha/Beta in one complementary group and worklogs on both.
+    """
+    monkeypatch.setattr(cache_module, "_storage", storage)
+    # Tables the dashboard reads but initialize() leaves to the SQL migrations
+    with sqlite3.connect(storage.db_path) as db:
+        for migration in (
+            "010_create_matching_algorithms.sql",
+            "011_create_jira_exclusions.sql",
+            "013_create_generic_issues.sql",
+        ):
+            with open(os.path.join(MIGRATIONS_DIR, migration)) as f:
+                db.executescript(f.read())
+    invalidate_config_info()
+    invalidate_me_responses()
+
+    company_id = await storage.create_company(name="Seeded Co", domain="seeded.test")
+    admin_id = await storage.create_oauth_user(
+        google_id="seeded-admin", email="admin@seeded.test", company_id=company_id, role="ADMIN"
+    )
+    user_ids = {
+        email: await storage.create_user(email, first, "Tester", company_id)
+        for email, first in (("anna@seeded.test", "Anna"), ("luca@seeded.test", "Luca"))
+    }
+
+    instance_ids = [
+        await storage.create_jira_instance(
+            name=name, url=f"https://{name.lower()}.example", email="bot@seeded.test",
+            api_token="token", company_id=company_id
+        )
+        for name in ("Alpha", "Beta")
+    ]
+    group_id = await storage.create_complementary_group(
+        name="Alpha/Beta", company_id=company_id, primary_instance_id=instance_ids[0]
+    )
+    for instance_id in instance_ids:
+        await storage.add_instance_to_complementary_group(group_id, instance_id, company_id)
+
+    def worklog(wl_id, instance, email, day, hours, parent_key, issue_key):
+        return Worklog(
+            id=wl_id, issue_key=issue_key, issue_summary=f"Work on {issue_key}",
+            author_email=email, author_display_name=email.split("@")[0],
+            time_spent_seconds=int(hours * 3600), started=datetime(2024, 3, day, 9, 0),
+            jira_instance=instance, parent_key=parent_key, parent_name=f"Initiative {parent_key}",
+            parent_type="Epic", epic_key=parent_key, epic_name=f"Initiative {parent_key}",
+            issue_type="Task"
+        )
+
+    await storage.upsert_worklogs([
+        worklog("a1", "Alpha", "anna@seeded.test", 4, 6, "ALP-1", "ALP-10"),
+        worklog("a2", "Alpha", "anna@seeded.test", 5, 2.5, "ALP-2", "ALP-20"),
+        worklog("a3", "Alpha", "luca@seeded.test", 5, 8, "ALP-1", "ALP-11"),
+        worklog("b1", "Beta", "anna@seeded.test", 4, 3, "ALP-1", "BET-10"),
+        worklog("b2", "Beta", "luca@seeded.test", 6, 7.25, "BET-5", "BET-50"),
+    ], company_id)
+
+    yield {
+        "company_id": company_id,
+        "user_ids": user_ids,
+        "token": create_access_token(admin_id, company_id, "admin@seeded.test", "ADMIN"),
+        "storage": storage
+    }
+
+    invalidate_config_info()
+    invalidate_me_responses()
@@ -0,0 +1,99 @@
+"""
+Columnar payload tests.
+
+Tests verify that ?columnar=true on the user and epic detail endpoints carries
+the same data as the row payload, only laid out as parallel lists.
+"""
+import pytest
+
+
+PERIOD = {"start_date": "2024-03-01", "end_date": "2024-03-31"}
+
+
+def make_auth_header(token: str) -> dict:
+    """Create Authorization header with token."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+def columns_to_rows(columns: dict) -> list[dict]:
+    """Transpose a worklog_columns payload back into one dict per worklog."""
+    count = len(next(iter(columns.values())))
+    assert all(len(values) == count for values in columns.values())
+    return [{name: values[i] for name, values in columns.items()} for i in range(count)]
+
+
+def trend_columns_to_rows(columns: dict) -> list[dict]:
+    """Zip a daily_trend_columns payload back into DailyHours dicts."""
+    assert len(columns["dates"]) == len(columns["hours"])
+    return [{"date": d, "hours": h} for d, h in zip(columns["dates"], columns["hours"])]
+
+
+def trend_matrix_to_rows(matrix: dict) -> dict[str, list[dict]]:
+    """Expand a daily_trend_by_instance_soa matrix back into per-instance DailyHours lists."""
+    assert len(matrix["instance_names"]) == len(matrix["hours"])
+    return {
+        name: trend_columns_to_rows({"dates": matrix["dates"], "hours": hours})
+        for name, hours in zip(matrix["instance_names"], matrix["hours"])
+    }
+
+
+async def get_both(client, url: str, token: str) -> tuple[dict, dict]:
+    """Fetch a detail endpoint as rows and as columns."""
+    responses = []
+    for columnar in ("false", "true"):
+        response = await client.get(
+            url, params={**PERIOD, "columnar": columnar}, headers=make_auth_header(token)
+        )
+        assert response.status_code == 200
+        responses.append(response.json())
+    return responses[0], responses[1]
+
+
+@pytest.mark.asyncio
+async def test_user_detail_columnar_matches_rows(client, seeded_company):
+    """Worklogs, daily trend and per-instance trend carry the same values in both layouts."""
+    user_id = seeded_company["user_ids"]["anna@seeded.test"]
+    rows, cols = await get_both(client, f"/api/users/{user_id}", seeded_company["token"])
+
+    assert cols["worklogs"] == []
+    assert cols["daily_trend"] == []
+    assert cols["daily_trend_by_instance"] == {}
+    assert rows["worklog_columns"] is None
+    assert rows["daily_trend_columns"] is None
+    assert rows["daily_trend_by_instance_soa"] is None
+
+    assert len(rows["worklogs"]) == 3
+    assert columns_to_rows(cols["worklog_columns"]) == rows["worklogs"]
+    assert trend_columns_to_rows(cols["daily_trend_columns"]) == rows["daily_trend"]
+    assert set(rows["daily_trend_by_instance"]) == {"Alpha", "Beta"}
+    assert trend_matrix_to_rows(cols["daily_trend_by_instance_soa"]) == rows["daily_trend_by_instance"]
+
+    shared = set(rows) - {
+        "worklogs", "worklog_columns", "daily_trend", "daily_trend_columns",
+        "daily_trend_by_instance", "daily_trend_by_instance_soa"
+    }
+    assert {k: cols[k] for k in shared} == {k: rows[k] for k in shared}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("epic_key, worklog_count", [
+    ("ALP-1", 3),
+    # No worklogs: the empty-response branch
+    ("NOPE-1", 0),
+])
+async def test_epic_detail_columnar_matches_rows(client, seeded_company, epic_key, worklog_count):
+    """Worklogs and daily trend carry the same values in both layouts."""
+    rows, cols = await get_both(client, f"/api/epics/{epic_key}", seeded_company["token"])
+
+    assert cols["worklogs"] == []
+    assert cols["daily_trend"] == []
+    assert rows["worklog_columns"] is None
+    assert rows["daily_trend_columns"] is None
+
+    assert len(rows["worklogs"]) == worklog_count
+    assert columns_to_rows(cols["worklog_columns"]) == rows["worklogs"]
+    assert len(rows["daily_trend"]) == 31
+    assert trend_columns_to_rows(cols["daily_trend_columns"]) == rows["daily_trend"]
+
+    shared = set(rows) - {"worklogs", "worklog_columns", "daily_trend", "daily_trend_columns"}
+    assert {k: cols[k] for k in shared} == {k: rows[k] for k in shared}
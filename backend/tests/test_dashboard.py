@@ -0,0 +1,51 @@
+"""
+Dashboard tests.
+
+Tests verify that the NDJSON stream endpoints of the multi-JIRA overview
+emit the same sections as the combined /multi-jira-overview response.
+"""
+import json
+
+import pytest
+
+
+PERIOD = {"start_date": "2024-03-01", "end_date": "2024-03-31"}
+
+
+def make_auth_header(token: str) -> dict:
+    """Create Authorization header with token."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def get_ndjson(client, url: str, token: str) -> list[dict]:
+    """GET an NDJSON endpoint and parse it, checking there is one JSON object per line."""
+    response = await client.get(url, params=PERIOD, headers=make_auth_header(token))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    assert response.text.endswith("\n")
+    lines = response.text[:-1].split("\n")
+    items = [json.loads(line) for line in lines]
+    assert all(isinstance(item, dict) for item in items)
+    return items
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path, section", [
+    ("/api/dashboard/multi-jira-overview/instances", "instances"),
+    ("/api/dashboard/multi-jira-overview/comparisons", "complementary_comparisons"),
+])
+async def test_multi_jira_stream_matches_overview_section(client, seeded_company, path, section):
+    """Each streamed line is one entry of the matching /multi-jira-overview section, in order."""
+    token = seeded_company["token"]
+
+    streamed = await get_ndjson(client, path, token)
+
+    response = await client.get(
+        "/api/dashboard/multi-jira-overview", params=PERIOD, headers=make_auth_header(token)
+    )
+    assert response.status_code == 200
+    expected = response.json()[section]
+
+    assert len(expected) > 0
+    assert streamed == expected
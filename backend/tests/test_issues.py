@@ -0,0 +1,60 @@
+"""
+Issue detail tests.
+
+Tests verify that /api/issues/{key} returns contributors and worklogs for an
+issue with logged time.
+"""
+from datetime import datetime
+
+import pytest
+
+from app.models import Worklog
+
+
+PERIOD = {"start_date": "2024-03-01", "end_date": "2024-03-31"}
+
+
+def make_auth_header(token: str) -> dict:
+    """Create Authorization header with token."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_issue_detail_with_worklogs(client, seeded_company, storage):
+    """Known users get their database name and team; unknown authors fall back to External."""
+    company_id = seeded_company["company_id"]
+    team_id = await storage.create_team("Platform", company_id)
+    await storage.update_user(seeded_company["user_ids"]["anna@seeded.test"], company_id, team_id=team_id)
+    await storage.upsert_worklogs([Worklog(
+        id="x1", issue_key="ALP-10", issue_summary="Work on ALP-10",
+        author_email="guest@elsewhere.test", author_display_name="Guest Writer",
+        time_spent_seconds=1800, started=datetime(2024, 3, 7, 9, 0), jira_instance="Alpha",
+        parent_key="ALP-1", parent_name="Initiative ALP-1", parent_type="Epic"
+    )], company_id)
+
+    response = await client.get(
+        "/api/issues/ALP-10", params=PERIOD, headers=make_auth_header(seeded_company["token"])
+    )
+    assert response.status_code == 200
+    body = response.json()
+
+    assert body["total_hours"] == 6.5
+    assert len(body["worklogs"]) == 2
+    assert body["contributors"] == [
+        {
+            "email": "anna@seeded.test",
+            "user_id": seeded_company["user_ids"]["anna@seeded.test"],
+            "full_name": "Anna Tester",
+            "role": "DEV",
+            "total_hours": 6.0,
+            "team_name": "Platform",
+        },
+        {
+            "email": "guest@elsewhere.test",
+            "user_id": None,
+            "full_name": "Guest Writer",
+            "role": None,
+            "total_hours": 0.5,
+            "team_name": "External",
+        },
+    ]
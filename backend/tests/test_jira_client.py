@@ -0,0 +1,76 @@
+"""
+JIRA HTTP client pool tests.
+
+Tests verify that pooled clients are evicted least recently used first and
+that an evicted client is only closed once its in-flight requests finish.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app import jira_client
+from app.jira_client import JiraClient
+from app.models import JiraInstanceConfig
+
+
+def make_client(host: str, api_token: str = "token") -> JiraClient:
+    """JiraClient for https://<host>.example with the given token."""
+    return JiraClient(JiraInstanceConfig(
+        name=host, url=f"https://{host}.example/", email="bot@example.test", api_token=api_token
+    ))
+
+
+@pytest.fixture
+async def small_pool(monkeypatch):
+    """Pool capped at three clients, emptied after the test."""
+    monkeypatch.setattr(jira_client, "JIRA_HTTP_CLIENT_POOL_SIZE", 3)
+    yield
+    await jira_client.close_jira_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_least_recently_used(small_pool):
+    """A cache hit keeps the client; the least recently used one is evicted and closed."""
+    first = make_client("alpha")._get_client()
+    assert make_client("alpha")._get_client() is first
+    rotated = make_client("alpha", api_token="old")._get_client()
+    assert rotated is not first
+
+    make_client("beta")._get_client()
+    make_client("alpha")._get_client()  # hit: alpha is now the most recently used
+    make_client("gamma")._get_client()  # full: evicts the rotated credentials
+    await asyncio.gather(*jira_client._closing_tasks)
+
+    assert make_client("alpha")._get_client() is first
+    assert not first.is_closed
+    assert rotated.is_closed
+    assert len(jira_client._http_clients) == 3
+
+
+@pytest.mark.asyncio
+async def test_evicted_client_finishes_in_flight_request(small_pool):
+    """Evicting a client mid-request defers closing it until the request completes."""
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_jira(request):
+        started.set()
+        await release.wait()
+        return httpx.Response(200, json={"accountId": "abc"})
+
+    busy = make_client("busy")
+    http_client = busy._get_client()
+    http_client._transport = httpx.MockTransport(slow_jira)
+    request = asyncio.create_task(busy._request("GET", "/myself"))
+    await started.wait()
+
+    for host in ("one", "two", "three"):
+        make_client(host)._get_client()
+    assert http_client not in jira_client._http_clients.values()
+    assert not http_client.is_closed
+
+    release.set()
+    assert await request == {"accountId": "abc"}
+    assert http_client.is_closed
+    assert not jira_client._evicted_http_clients
+    assert not jira_client._in_flight_requests
@@ -0,0 +1,93 @@
+"""
+Package creation tests.
+
+Tests verify that creating a package on several JIRA instances saves the
+cross-instance links between the parents and between matching children.
+"""
+import pytest
+
+import app.cache
+from app.auth.jwt import create_access_token
+from app.routers import packages
+
+
+def make_auth_header(token: str) -> dict:
+    """Create Authorization header with token."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+class FakeJiraClient:
+    """Stands in for JiraClient: issue keys are <PROJECT>-<n>, numbered per instance."""
+
+    def __init__(self, config):
+        self.config = config
+        self.counter = 0
+
+    def _next_key(self, project_key: str) -> str:
+        self.counter += 1
+        return f"{project_key}-{self.counter}"
+
+    async def create_issue(self, project_key, summary, issue_type, description=None, parent_key=None):
+        return {"key": self._next_key(project_key)}
+
+    async def create_issues_bulk(self, issues):
+        return {"issues": [{"key": self._next_key(i["project_key"])} for i in issues], "errors": []}
+
+
+@pytest.fixture
+async def admin_context(storage, monkeypatch):
+    """Company with an ADMIN user and two JIRA instances, served by the app's storage."""
+    monkeypatch.setattr(app.cache, "_storage", storage)
+    monkeypatch.setattr(packages, "JiraClient", FakeJiraClient)
+
+    company_id = await storage.create_company(name="Package Co", domain="package.test")
+    user_id = await storage.create_oauth_user(
+        google_id="pkg-admin", email="admin@package.test", company_id=company_id, role="ADMIN"
+    )
+    for name in ("Alpha", "Beta"):
+        await storage.create_jira_instance(
+            name=name, url=f"https://{name.lower()}.example", email="bot@package.test",
+            api_token="token", company_id=company_id
+        )
+
+    token = create_access_token(user_id, company_id, "admin@package.test", "ADMIN")
+    return {"company_id": company_id, "token": token, "storage": storage}
+
+
+@pytest.mark.asyncio
+async def test_create_package_on_two_instances_saves_links(client, admin_context):
+    """Parents and same-element children are linked across instances."""
+    response = await client.post(
+        "/api/packages/create",
+        headers=make_auth_header(admin_context["token"]),
+        json={
+            "instance_configs": [
+                {"instance_name": "Alpha", "project_key": "ALP"},
+                {"instance_name": "Beta", "project_key": "BET"},
+            ],
+            "parent_summary": "Release 1",
+            "selected_elements": ["Design", "Build"],
+        }
+    )
+    assert response.status_code == 200
+    body = response.json()
+
+    assert body["success"] is True
+    assert body["errors"] == []
+    assert [r["parent_key"] for r in body["results"]] == ["ALP-1", "BET-1"]
+    assert [c["key"] for c in body["results"][0]["children"]] == ["ALP-2", "ALP-3"]
+    # One parent link per instance plus one link per instance for each element
+    assert len(body["linked_issues"]) == 6
+
+    storage = admin_context["storage"]
+    company_id = admin_context["company_id"]
+    linked_parent = await storage.get_linked_issues_by_key("ALP-1", "Alpha", company_id)
+    assert [(l["issue_key"], l["jira_instance"], l["element_name"]) for l in linked_parent] == [
+        ("BET-1", "Beta", "parent")
+    ]
+    linked_child = await storage.get_linked_issues_by_key("ALP-3", "Alpha", company_id)
+    assert [(l["issue_key"], l["element_name"]) for l in linked_child] == [("BET-3", "Build")]
+
+    # Links are scoped to the company that created them
+    other_company_id = await storage.create_company(name="Other Co", domain="other.test")
+    assert await storage.get_linked_issues_by_key("ALP-1", "Alpha", other_company_id) == []
@@ -158,7 +158,7 @@ export default function IssueView({ dateRange }) {
     // Prepare contributor data (top contributors)
     const contributorData = data.contributors
         .map((c) => {
-            const displayName = c.display_name || c.email || 'Unknown'
+            const displayName = c.full_name || c.email || 'Unknown'
             return {
                 name: displayName.length > 20 ? displayName.substring(0, 20) + '...' : displayName,
                 hours: c.total_hours,